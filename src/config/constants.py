@@ -119,3 +119,9 @@ MAX_ALERTS_PER_USER: Final[int] = 20
 
 # Posted events to keep for Chrome extension sync
 MAX_POSTED_EVENTS: Final[int] = 50
+
+# How long a fetched list of recent events is served from cache (seconds)
+RECENT_EVENTS_CACHE_TTL: Final[float] = 5.0
+
+# How long fetched market prices are reused for alert checks (seconds)
+PRICE_CACHE_TTL: Final[float] = 5.0
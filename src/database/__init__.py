@@ -1,7 +1,7 @@
 """Database module with SQLAlchemy models and repository."""
 
 from src.database.models import Base, User, SeenEvent, Keyword, PriceAlert, WatchlistItem, NewsCache
-from src.database.connection import DatabaseManager, get_db
+from src.database.connection import DatabaseManager, get_db, init_db_manager
 from src.database.repository import Repository
 
 __all__ = [
@@ -14,5 +14,6 @@ __all__ = [
     "NewsCache",
     "DatabaseManager",
     "get_db",
+    "init_db_manager",
     "Repository",
 ]
@@ -1,29 +1,70 @@
 """Database connection management."""
 
 import logging
+from collections.abc import Awaitable, Callable
 from contextlib import asynccontextmanager
 from pathlib import Path
-from typing import AsyncGenerator
+from typing import Any, AsyncGenerator
 
+from sqlalchemy import make_url
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.pool import AsyncAdaptedQueuePool, StaticPool
 
-from src.database.models import Base
+from src.database.models import ALERT_CHANGED_CHANNEL, Base
 
 logger = logging.getLogger(__name__)
 
+# Notify listeners when a price alert is added (PostgreSQL only)
+_ALERT_NOTIFY_DDL = (
+    f"""
+    CREATE OR REPLACE FUNCTION notify_alert_changed() RETURNS trigger AS $$
+    BEGIN
+        PERFORM pg_notify('{ALERT_CHANGED_CHANNEL}', NEW.event_slug);
+        RETURN NEW;
+    END;
+    $$ LANGUAGE plpgsql
+    """,
+    "DROP TRIGGER IF EXISTS price_alerts_notify ON price_alerts",
+    """
+    CREATE TRIGGER price_alerts_notify
+    AFTER INSERT ON price_alerts
+    FOR EACH ROW EXECUTE FUNCTION notify_alert_changed()
+    """,
+)
+
 
 class DatabaseManager:
     """Manages database connections and sessions."""
 
-    def __init__(self, database_url: str) -> None:
+    def __init__(
+        self,
+        database_url: str,
+        pool_size: int = 5,
+        max_overflow: int = 10,
+        pool_recycle: int = 1800,
+    ) -> None:
         self.database_url = database_url
+        self._closed = False
         self._ensure_data_directory()
 
-        self.engine = create_async_engine(
-            database_url,
-            echo=False,
-            pool_pre_ping=True,
-        )
+        engine_kwargs: dict[str, Any] = {}
+        if self.is_memory:
+            # One connection (and aiosqlite thread) reused by every session keeps
+            # the in-memory database alive across checkouts
+            engine_kwargs.update(
+                poolclass=StaticPool,
+                connect_args={"check_same_thread": False, "uri": True},
+            )
+        else:
+            engine_kwargs.update(
+                poolclass=AsyncAdaptedQueuePool,
+                pool_size=pool_size,
+                max_overflow=max_overflow,
+                pool_recycle=pool_recycle,
+                pool_pre_ping=False,
+            )
+
+        self.engine = create_async_engine(database_url, echo=False, **engine_kwargs)
         self.session_factory = async_sessionmaker(
             self.engine,
             class_=AsyncSession,
@@ -31,6 +72,14 @@ class DatabaseManager:
             autoflush=False,
         )
 
+    @property
+    def is_memory(self) -> bool:
+        """Whether the database is an in-memory SQLite database."""
+        url = make_url(self.database_url)
+        if url.get_backend_name() != "sqlite":
+            return False
+        return url.database in (None, "", ":memory:") or url.query.get("mode") == "memory"
+
     def _ensure_data_directory(self) -> None:
         """Create data directory if it doesn't exist (for SQLite)."""
         if "sqlite" in self.database_url:
@@ -38,17 +87,67 @@ class DatabaseManager:
             if db_path and db_path != ":memory:":
                 Path(db_path).parent.mkdir(parents=True, exist_ok=True)
 
+    @property
+    def is_postgres(self) -> bool:
+        """Whether the database backend is PostgreSQL."""
+        return self.engine.dialect.name == "postgresql"
+
     async def init_db(self) -> None:
         """Initialize database tables."""
         async with self.engine.begin() as conn:
             await conn.run_sync(Base.metadata.create_all)
+            if self.is_postgres:
+                for statement in _ALERT_NOTIFY_DDL:
+                    await conn.exec_driver_sql(statement)
         logger.info("Database tables initialized")
 
     async def close(self) -> None:
-        """Close database connection."""
+        """Close database connection. Safe to call more than once."""
+        if self._closed:
+            return
+        self._closed = True
         await self.engine.dispose()
         logger.info("Database connection closed")
 
+    async def listen_alerts(
+        self, callback: Callable[[str], None]
+    ) -> Callable[[], Awaitable[None]] | None:
+        """
+        Subscribe to new alert notifications.
+
+        Calls ``callback`` with the alert's event slug. Only supported on
+        PostgreSQL with asyncpg; returns None for other backends, otherwise
+        a coroutine function that removes the listener and releases its
+        dedicated autocommit connection.
+        """
+        dialect = self.engine.dialect
+        if dialect.name != "postgresql" or dialect.driver != "asyncpg":
+            return None
+
+        # Autocommit, so the long-lived listener never sits idle in a transaction
+        conn = await self.engine.connect()
+        try:
+            await conn.execution_options(isolation_level="AUTOCOMMIT")
+            raw_conn = await conn.get_raw_connection()
+            driver_conn = raw_conn.driver_connection
+            assert driver_conn is not None
+
+            def _on_notify(_conn: Any, _pid: int, _channel: str, payload: str) -> None:
+                callback(payload)
+
+            await driver_conn.add_listener(ALERT_CHANGED_CHANNEL, _on_notify)
+        except BaseException:
+            await conn.close()
+            raise
+
+        async def unlisten() -> None:
+            try:
+                await driver_conn.remove_listener(ALERT_CHANGED_CHANNEL, _on_notify)
+            finally:
+                await conn.close()
+
+        return unlisten
+
     @asynccontextmanager
     async def session(self) -> AsyncGenerator[AsyncSession, None]:
         """Get a database session with automatic commit/rollback."""
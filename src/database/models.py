@@ -89,6 +89,10 @@ class UserCategory(Base):
     __table_args__ = (UniqueConstraint("user_id", "category", name="uq_user_category"),)
 
 
+# PostgreSQL NOTIFY channel carrying the event slug of new price alerts
+ALERT_CHANGED_CHANNEL = "alert_changed"
+
+
 class PriceAlert(Base):
     """Price alerts set by users."""
 
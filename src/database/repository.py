@@ -1,10 +1,12 @@
 """Repository pattern for database operations."""
 
 import logging
+from collections.abc import Collection, Iterable
 from datetime import datetime
 from typing import Any
 
-from sqlalchemy import delete, func, select
+from sqlalchemy import CursorResult, and_, case, delete, exists, func, literal, or_, select
+from sqlalchemy.dialects import postgresql, sqlite
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.database.models import (
@@ -17,6 +19,7 @@ from src.database.models import (
     UserCategory,
     WatchlistItem,
 )
+from src.utils.helpers import hash_context, matching_categories, searchable_text
 
 logger = logging.getLogger(__name__)
 
@@ -24,9 +27,18 @@ logger = logging.getLogger(__name__)
 class Repository:
     """Repository for all database operations."""
 
+    # Stateless apart from the session, so it is cheap to build one per session
+    __slots__ = ("session",)
+
     def __init__(self, session: AsyncSession) -> None:
         self.session = session
 
+    def _insert(self, model: type[Any]) -> Any:
+        """Dialect-specific INSERT for the session's backend (supports ON CONFLICT)."""
+        if self.session.get_bind().dialect.name == "postgresql":
+            return postgresql.insert(model)
+        return sqlite.insert(model)
+
     # ==================== User Operations ====================
 
     async def get_user(self, telegram_id: int) -> User | None:
@@ -46,11 +58,25 @@ class Repository:
 
     async def get_or_create_user(self, telegram_id: int) -> tuple[User, bool]:
         """Get existing user or create new one. Returns (user, created)."""
+        # Existing users are the common case: one read, no write lock
         user = await self.get_user(telegram_id)
-        if user:
+        if user is not None:
             return user, False
-        user = await self.create_user(telegram_id)
-        return user, True
+
+        # RETURNING yields a row only when this call inserted the user
+        user = await self.session.scalar(
+            self._insert(User)
+            .values(telegram_id=telegram_id)
+            .on_conflict_do_nothing(index_elements=[User.telegram_id])
+            .returning(User)
+        )
+        if user is not None:
+            logger.info(f"Created user {telegram_id}")
+            return user, True
+
+        # Lost a race with a concurrent insert of the same user
+        existing = await self.session.scalars(select(User).where(User.telegram_id == telegram_id))
+        return existing.one(), False
 
     async def get_all_users(self) -> list[User]:
         """Get all subscribed users."""
@@ -93,6 +119,17 @@ class Repository:
         if not await self.is_event_seen(event_id):
             self.session.add(SeenEvent(event_id=event_id))
 
+    async def mark_events_seen(self, event_ids: Iterable[str]) -> None:
+        """Mark several events as seen in one statement, skipping known ones."""
+        rows = [{"event_id": event_id} for event_id in event_ids]
+        if not rows:
+            return
+        await self.session.execute(
+            self._insert(SeenEvent)
+            .values(rows)
+            .on_conflict_do_nothing(index_elements=[SeenEvent.event_id])
+        )
+
     async def get_seen_events_count(self) -> int:
         """Get count of seen events."""
         result = await self.session.execute(select(func.count(SeenEvent.id)))
@@ -187,6 +224,56 @@ class Repository:
         await self.session.execute(delete(UserCategory).where(UserCategory.user_id == user.id))
         return True
 
+    async def find_users_matching_events(
+        self, events: list[dict[str, Any]]
+    ) -> dict[int, list[str]]:
+        """
+        Find active users whose keyword and category filters match the events.
+
+        Mirrors matches_keywords/matches_category, but evaluates the filters in
+        the database so user filters are never loaded into Python.
+        Returns a mapping of telegram_id to matching event ids, in event order.
+        """
+        is_postgres = self.session.get_bind().dialect.name == "postgresql"
+        contains = func.strpos if is_postgres else func.instr
+
+        # Quoted phrases are matched without their surrounding quotes
+        kw = Keyword.keyword
+        quoted = and_(
+            func.length(kw) > 1,
+            or_(
+                and_(kw.startswith('"'), kw.endswith('"')),
+                and_(kw.startswith("'"), kw.endswith("'")),
+            ),
+        )
+        phrase = case((quoted, func.substr(kw, 2, func.length(kw) - 2)), else_=kw)
+
+        has_keywords = exists().where(Keyword.user_id == User.id)
+        has_categories = exists().where(UserCategory.user_id == User.id)
+
+        matches: dict[int, list[str]] = {}
+        for event in events:
+            event_id = str(event.get("id", ""))
+            searchable = searchable_text(event)
+            keyword_hit = exists().where(
+                Keyword.user_id == User.id,
+                kw != "",
+                contains(literal(searchable), phrase) > 0,
+            )
+            category_hit = exists().where(
+                UserCategory.user_id == User.id,
+                UserCategory.category.in_(matching_categories(searchable)),
+            )
+            stmt = select(User.telegram_id).where(
+                User.is_paused.is_(False),
+                or_(~has_keywords, keyword_hit),
+                or_(~has_categories, category_hit),
+            )
+            for telegram_id in await self.session.scalars(stmt):
+                matches.setdefault(telegram_id, []).append(event_id)
+
+        return matches
+
     # ==================== Watchlist Operations ====================
 
     async def get_user_watchlist(self, telegram_id: int) -> list[str]:
@@ -296,6 +383,35 @@ class Repository:
         logger.info(f"User {telegram_id} added alert: {event_slug} {condition} {threshold}")
         return True
 
+    async def add_alerts(self, telegram_id: int, items: Iterable[tuple[str, str, float]]) -> int:
+        """Add several (event_slug, condition, threshold) alerts at once. Returns count added."""
+        user = await self.get_user(telegram_id)
+        if not user:
+            return 0
+
+        rows = [
+            {"user_id": user.id, "event_slug": slug, "condition": condition, "threshold": threshold}
+            for slug, condition, threshold in items
+        ]
+        if not rows:
+            return 0
+
+        result: CursorResult[Any] = await self.session.execute(
+            self._insert(PriceAlert)
+            .values(rows)
+            .on_conflict_do_nothing(
+                index_elements=[
+                    PriceAlert.user_id,
+                    PriceAlert.event_slug,
+                    PriceAlert.condition,
+                    PriceAlert.threshold,
+                    PriceAlert.outcome_index,
+                ]
+            )
+        )
+        logger.info(f"User {telegram_id} added {result.rowcount} alerts")
+        return result.rowcount
+
     async def remove_alert(self, telegram_id: int, alert_index: int) -> bool:
         """Remove alert by index (0-based)."""
         alerts = await self.get_user_alerts(telegram_id)
@@ -306,13 +422,19 @@ class Repository:
         await self.session.delete(alert)
         return True
 
-    async def get_all_active_alerts(self) -> list[tuple[int, PriceAlert]]:
-        """Get all active (non-triggered) alerts with user telegram_id."""
-        result = await self.session.execute(
+    async def get_all_active_alerts(
+        self, event_slugs: Collection[str] | None = None
+    ) -> list[tuple[int, PriceAlert]]:
+        """Get active (non-triggered) alerts with user telegram_id, optionally for given slugs."""
+        query = (
             select(User.telegram_id, PriceAlert)
             .join(PriceAlert, User.id == PriceAlert.user_id)
             .where(PriceAlert.is_triggered == False)
         )
+        if event_slugs is not None:
+            query = query.where(PriceAlert.event_slug.in_(event_slugs))
+
+        result = await self.session.execute(query)
         return [(telegram_id, alert) for telegram_id, alert in result]
 
     async def mark_alert_triggered(self, alert_id: int) -> None:
@@ -343,6 +465,11 @@ class Repository:
         if cache:
             if cache.context_hash == context_hash:
                 return False  # No change
+            # Hashes stored by an older hash_context (MD5) never match; compare
+            # against the stored preview instead of reporting a spurious update.
+            if cache.context_preview and hash_context(cache.context_preview) == context_hash:
+                cache.context_hash = context_hash
+                return False
             cache.context_hash = context_hash
             cache.context_preview = context_preview[:500]
         else:
@@ -61,6 +61,14 @@ async def main() -> None:
 
 def run() -> None:
     """Run the application."""
+    # Use uvloop where available (not on Windows); fall back to the stock loop
+    try:
+        import uvloop
+
+        uvloop.install()
+    except ImportError:
+        pass
+
     try:
         asyncio.run(main())
     except KeyboardInterrupt:
@@ -1,11 +1,13 @@
 """Services module for business logic."""
 
+from src.services.periodic import PeriodicService
 from src.services.polymarket import PolymarketService
 from src.services.event_monitor import EventMonitorService
 from src.services.alert_monitor import AlertMonitorService
 from src.services.news_monitor import NewsMonitorService
 
 __all__ = [
+    "PeriodicService",
     "PolymarketService",
     "EventMonitorService",
     "AlertMonitorService",
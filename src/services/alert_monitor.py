@@ -1,71 +1,95 @@
 """Price alert monitoring service."""
 
-import asyncio
 import logging
-from typing import Any, Callable, Coroutine
+import time
+from collections.abc import Awaitable, Callable, Coroutine
+from typing import Any
 
 from src.config import get_settings
 from src.database import DatabaseManager, Repository
+from src.services.periodic import PeriodicService
 from src.services.polymarket import PolymarketService
 
 logger = logging.getLogger(__name__)
 
+ALERT_MSG_TMPL = (
+    "<b>Price Alert Triggered!</b>\n\n"
+    "<b>Event:</b> {slug}\n"
+    "<b>Current price:</b> {price:.1f}%\n"
+    "<b>Condition:</b> {condition} {threshold}%\n\n"
+    "<a href='https://polymarket.com/event/{slug}'>View Event</a>"
+)
 
-class AlertMonitorService:
+
+class AlertMonitorService(PeriodicService):
     """Service for monitoring price alerts."""
 
+    name = "alert monitor"
+
     def __init__(
         self,
         db: DatabaseManager,
         polymarket: PolymarketService,
         send_notification: Callable[[int, str], Coroutine[Any, Any, bool]],
     ) -> None:
+        settings = get_settings()
+        super().__init__(settings.alert_check_interval)
+
         self.db = db
         self.polymarket = polymarket
         self.send_notification = send_notification
-        self._running = False
-        self._task: asyncio.Task[None] | None = None
 
-        settings = get_settings()
-        self.check_interval = settings.alert_check_interval
+        # Wake-ups from PostgreSQL LISTEN/NOTIFY (unused on other backends)
+        self._unlisten: Callable[[], Awaitable[None]] | None = None
+        self._changed_slugs: set[str] = set()
+        self._next_full_check = 0.0
 
-    async def start(self) -> None:
-        """Start the alert monitoring loop."""
-        if self._running:
+    async def _on_start(self) -> None:
+        """Listen for new alerts if the database supports notifications."""
+        try:
+            self._unlisten = await self.db.listen_alerts(self._on_alert_changed)
+        except Exception as e:
+            logger.warning(f"Alert notifications unavailable, polling only: {e}")
             return
 
-        self._running = True
-        self._task = asyncio.create_task(self._monitor_loop())
-        logger.info("Alert monitor started")
+        if self._unlisten is not None:
+            logger.info("Alert monitor listening for alert changes")
+
+    async def _on_stop(self) -> None:
+        """Stop listening for new alerts."""
+        if self._unlisten:
+            await self._unlisten()
+            self._unlisten = None
+
+    def _on_alert_changed(self, slug: str) -> None:
+        """Queue an event slug for checking and wake the monitor loop."""
+        self._changed_slugs.add(slug)
+        self.notify_now()
+
+    async def _setup(self) -> None:
+        """Schedule the first full check."""
+        self._next_full_check = time.monotonic() + self.check_interval
+
+    def _next_timeout(self) -> float:
+        """Wait until the next full check is due."""
+        return self._next_full_check - time.monotonic()
+
+    async def _tick(self) -> None:
+        """Check alerts for changed events, or all alerts when a full check is due."""
+        if self._changed_slugs and time.monotonic() < self._next_full_check:
+            slugs, self._changed_slugs = self._changed_slugs, set()
+            await self._check_alerts(slugs)
+            return
 
-    async def stop(self) -> None:
-        """Stop the alert monitoring loop."""
-        self._running = False
-        if self._task:
-            self._task.cancel()
-            try:
-                await self._task
-            except asyncio.CancelledError:
-                pass
-            self._task = None
-        logger.info("Alert monitor stopped")
-
-    async def _monitor_loop(self) -> None:
-        """Main monitoring loop."""
-        while self._running:
-            try:
-                await asyncio.sleep(self.check_interval)
-                await self._check_alerts()
-            except asyncio.CancelledError:
-                break
-            except Exception as e:
-                logger.error(f"Error in alert monitoring: {e}")
+        self._changed_slugs.clear()
+        self._next_full_check = time.monotonic() + self.check_interval
+        await self._check_alerts()
 
-    async def _check_alerts(self) -> None:
-        """Check all active alerts and trigger if conditions met."""
+    async def _check_alerts(self, event_slugs: set[str] | None = None) -> None:
+        """Check active alerts (all, or only for given slugs) and trigger if conditions met."""
         async with self.db.session() as session:
             repo = Repository(session)
-            active_alerts = await repo.get_all_active_alerts()
+            active_alerts = await repo.get_all_active_alerts(event_slugs)
 
             if not active_alerts:
                 return
@@ -79,30 +103,26 @@ class AlertMonitorService:
 
             logger.debug(f"Checking {len(active_alerts)} alerts for {len(alerts_by_slug)} events")
 
+            prices_by_slug = await self.polymarket.fetch_prices(alerts_by_slug)
+
             # Check each event
             for slug, slug_alerts in alerts_by_slug.items():
-                await self._check_event_alerts(repo, slug, slug_alerts)
-                await asyncio.sleep(0.5)  # Rate limit API calls
+                prices = prices_by_slug.get(slug)
+                if prices is None:
+                    logger.warning(f"Could not fetch prices for alert check: {slug}")
+                    continue
+                await self._check_event_alerts(repo, slug_alerts, prices)
 
     async def _check_event_alerts(
         self,
         repo: Repository,
-        slug: str,
         alerts: list[tuple[int, Any]],
+        prices: list[float],
     ) -> None:
         """Check alerts for a specific event."""
-        event_data = await self.polymarket.fetch_event_by_slug(slug)
-        if not event_data:
-            logger.warning(f"Could not fetch event for alert check: {slug}")
-            return
-
-        markets = event_data.get("markets", [])
-        if not markets:
-            return
-
         for telegram_id, alert in alerts:
             try:
-                await self._check_single_alert(repo, telegram_id, alert, markets)
+                await self._check_single_alert(repo, telegram_id, alert, prices)
             except Exception as e:
                 logger.error(f"Error checking alert {alert.id}: {e}")
 
@@ -111,29 +131,13 @@ class AlertMonitorService:
         repo: Repository,
         telegram_id: int,
         alert: Any,
-        markets: list[dict[str, Any]],
+        prices: list[float],
     ) -> None:
-        """Check a single alert against current prices."""
-        if alert.outcome_index >= len(markets):
-            return
-
-        market = markets[0]  # Use first market for now
-        prices_raw = market.get("outcomePrices", [])
-
-        # Parse prices
-        if isinstance(prices_raw, str):
-            import json
-            try:
-                prices = json.loads(prices_raw)
-            except json.JSONDecodeError:
-                return
-        else:
-            prices = prices_raw
-
+        """Check a single alert against current prices of the event's first market."""
         if alert.outcome_index >= len(prices):
             return
 
-        current_price = float(prices[alert.outcome_index]) * 100
+        current_price = prices[alert.outcome_index] * 100
 
         # Check condition
         should_trigger = False
@@ -157,12 +161,13 @@ class AlertMonitorService:
         await repo.mark_alert_triggered(alert.id)
 
         # Send notification
-        msg = (
-            f"<b>Price Alert Triggered!</b>\n\n"
-            f"<b>Event:</b> {alert.event_slug}\n"
-            f"<b>Current price:</b> {current_price:.1f}%\n"
-            f"<b>Condition:</b> {alert.condition} {alert.threshold}%\n\n"
-            f"<a href='https://polymarket.com/event/{alert.event_slug}'>View Event</a>"
+        msg = ALERT_MSG_TMPL.format_map(
+            {
+                "slug": alert.event_slug,
+                "price": current_price,
+                "condition": alert.condition,
+                "threshold": alert.threshold,
+            }
         )
 
         try:
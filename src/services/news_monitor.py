@@ -7,65 +7,44 @@ from typing import Any, Callable, Coroutine
 
 from src.config import get_settings
 from src.database import DatabaseManager, Repository
+from src.services.periodic import PeriodicService
 from src.services.polymarket import PolymarketService
 from src.utils.helpers import hash_context
 
 logger = logging.getLogger(__name__)
 
+UPDATE_MSG_TMPL = "<b>%s</b>\nhttps://polymarket.com/event/%s\n<b>New Update:</b>\n%s"
 
-class NewsMonitorService:
+
+class NewsMonitorService(PeriodicService):
     """Service for monitoring news/context updates on watchlist events."""
 
+    name = "news monitor"
+
     def __init__(
         self,
         db: DatabaseManager,
         polymarket: PolymarketService,
         send_notification: Callable[[int, str], Coroutine[Any, Any, bool]],
     ) -> None:
+        # Check every 30 seconds for users who need updates
+        super().__init__(30)
+
         self.db = db
         self.polymarket = polymarket
         self.send_notification = send_notification
-        self._running = False
-        self._task: asyncio.Task[None] | None = None
         self._last_check: dict[int, float] = {}  # user_id -> timestamp
 
         settings = get_settings()
         self.default_interval = settings.news_check_interval
 
-    async def start(self) -> None:
-        """Start the news monitoring loop."""
-        if self._running:
-            return
-
-        self._running = True
-        self._task = asyncio.create_task(self._monitor_loop())
-        logger.info("News monitor started")
+    async def _setup(self) -> None:
+        """Initial delay, so the first check runs a minute after start."""
+        await asyncio.sleep(30)
 
-    async def stop(self) -> None:
-        """Stop the news monitoring loop."""
-        self._running = False
-        if self._task:
-            self._task.cancel()
-            try:
-                await self._task
-            except asyncio.CancelledError:
-                pass
-            self._task = None
-        logger.info("News monitor stopped")
-
-    async def _monitor_loop(self) -> None:
-        """Main monitoring loop."""
-        # Initial delay
-        await asyncio.sleep(60)
-
-        while self._running:
-            try:
-                await self._check_all_watchlists()
-                await asyncio.sleep(30)  # Check every 30 seconds for users who need updates
-            except asyncio.CancelledError:
-                break
-            except Exception as e:
-                logger.error(f"Error in news monitoring: {e}")
+    async def _tick(self) -> None:
+        """Check watchlists of users whose interval has elapsed."""
+        await self._check_all_watchlists()
 
     async def _check_all_watchlists(self) -> None:
         """Check watchlists for all users based on their intervals."""
@@ -146,16 +125,13 @@ class NewsMonitorService:
             return
 
         interval_min = user_interval // 60
-        msg_parts = []
 
         # Add updates
-        for slug, context in updates:
-            truncated = context[:800] + ("..." if len(context) > 800 else "")
-            msg_parts.append(
-                f"<b>{slug}</b>\n"
-                f"https://polymarket.com/event/{slug}\n"
-                f"<b>New Update:</b>\n{truncated}"
-            )
+        msg_parts = [
+            UPDATE_MSG_TMPL
+            % (slug, slug, (context[:800] + "...") if len(context) > 800 else context)
+            for slug, context in updates
+        ]
 
         # Add no-update items
         if no_updates:
@@ -169,7 +145,7 @@ class NewsMonitorService:
             f"<b>Watchlist Status</b> ({datetime.now().strftime('%H:%M')})\n"
             f"Next update in {interval_min} min\n\n"
         )
-        full_msg = header + "\n\n".join(msg_parts)
+        full_msg = "".join((header, "\n\n".join(msg_parts)))
 
         # Truncate if too long
         if len(full_msg) > 4000:
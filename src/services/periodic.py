@@ -0,0 +1,90 @@
+"""Base class for background services that run on an interval."""
+
+import asyncio
+import contextlib
+import logging
+from abc import ABC, abstractmethod
+
+logger = logging.getLogger(__name__)
+
+
+class PeriodicService(ABC):
+    """Background service that runs ``_tick`` every ``check_interval`` seconds."""
+
+    name = "periodic service"
+
+    def __init__(self, check_interval: float) -> None:
+        self.check_interval = check_interval
+        self._running = False
+        self._task: asyncio.Task[None] | None = None
+        self._wake = asyncio.Event()
+
+    async def start(self) -> None:
+        """Start the monitoring loop."""
+        if self._running:
+            return
+
+        self._running = True
+        await self._on_start()
+        self._task = asyncio.create_task(self._monitor_loop())
+        logger.info(f"{self.name.capitalize()} started")
+
+    async def stop(self) -> None:
+        """Stop the monitoring loop."""
+        self._running = False
+        if self._task:
+            self._task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._task
+            self._task = None
+        await self._on_stop()
+        logger.info(f"{self.name.capitalize()} stopped")
+
+    def notify_now(self) -> None:
+        """Wake the loop so the next tick runs without waiting for the interval."""
+        self._wake.set()
+
+    async def _on_start(self) -> None:
+        """Hook run by start() before the loop task is created."""
+        return None
+
+    async def _on_stop(self) -> None:
+        """Hook run by stop() after the loop task has finished."""
+        return None
+
+    async def _setup(self) -> None:
+        """Hook run in the loop task before the first wait."""
+        return None
+
+    def _next_timeout(self) -> float:
+        """Seconds to wait before the next tick."""
+        return self.check_interval
+
+    async def _wait(self, timeout: float) -> bool:
+        """Wait until notify_now() is called or the timeout passes. Returns True if woken."""
+        wake = asyncio.create_task(self._wake.wait())
+        sleep = asyncio.create_task(asyncio.sleep(max(timeout, 0)))
+        try:
+            done, _ = await asyncio.wait({wake, sleep}, return_when=asyncio.FIRST_COMPLETED)
+        finally:
+            wake.cancel()
+            sleep.cancel()
+        self._wake.clear()
+        return wake in done
+
+    async def _monitor_loop(self) -> None:
+        """Main monitoring loop."""
+        await self._setup()
+
+        while self._running:
+            try:
+                await self._wait(self._next_timeout())
+                await self._tick()
+            except asyncio.CancelledError:
+                break
+            except Exception as e:
+                logger.error(f"Error in {self.name}: {e}")
+
+    @abstractmethod
+    async def _tick(self) -> None:
+        """Run one monitoring pass."""
@@ -1,11 +1,15 @@
 """Polymarket API service with proper SSL handling."""
 
 import asyncio
+import json
 import logging
+import time
+from collections.abc import Iterable
 from typing import Any, Optional
 
 from src.config import get_settings
-from src.utils.http import HttpClient
+from src.config.constants import PRICE_CACHE_TTL, RECENT_EVENTS_CACHE_TTL
+from src.utils.http import NOT_MODIFIED, HttpClient
 
 logger = logging.getLogger(__name__)
 
@@ -21,6 +25,13 @@ class PolymarketService:
         self.context_timeout = settings.market_context_timeout
         self._http_client: Optional[HttpClient] = None
 
+        # (fetched_at, limit, events) of the last recent-events fetch
+        self._recent_cache: Optional[tuple[float, int, list[dict[str, Any]]]] = None
+        self._recent_refresh: Optional[asyncio.Task[list[dict[str, Any]]]] = None
+
+        # slug -> (fetched_at, outcome prices of the event's first market)
+        self._price_cache: dict[str, tuple[float, list[float]]] = {}
+
     async def _get_client(self) -> HttpClient:
         """Get or create HTTP client."""
         if self._http_client is None:
@@ -29,6 +40,10 @@ class PolymarketService:
 
     async def close(self) -> None:
         """Close HTTP client."""
+        if self._recent_refresh and not self._recent_refresh.done():
+            self._recent_refresh.cancel()
+        self._recent_refresh = None
+
         if self._http_client:
             await self._http_client.close()
             self._http_client = None
@@ -47,8 +62,88 @@ class PolymarketService:
         logger.warning(f"Event not found: {slug}")
         return None
 
-    async def fetch_recent_events(self, limit: int = 20) -> list[dict[str, Any]]:
-        """Fetch recent active events sorted by creation date."""
+    async def fetch_prices(
+        self, slugs: Iterable[str], max_stale: float = PRICE_CACHE_TTL
+    ) -> dict[str, list[float]]:
+        """
+        Fetch outcome prices (0-1) of each event's first market, keyed by slug.
+
+        Prices are cached per slug for up to ``max_stale`` seconds. Events that
+        could not be fetched or have no prices are left out of the result.
+        """
+        now = time.monotonic()
+        self._price_cache = {
+            slug: entry for slug, entry in self._price_cache.items() if now - entry[0] < max_stale
+        }
+
+        prices: dict[str, list[float]] = {}
+        fetched = False
+
+        for slug in slugs:
+            cached = self._price_cache.get(slug)
+            if cached:
+                prices[slug] = cached[1]
+                continue
+
+            if fetched:
+                await asyncio.sleep(0.5)  # Rate limit API calls
+            fetched = True
+
+            event_data = await self.fetch_event_by_slug(slug)
+            market_prices = self._parse_first_market_prices(event_data) if event_data else None
+            if market_prices is None:
+                continue
+
+            self._price_cache[slug] = (time.monotonic(), market_prices)
+            prices[slug] = market_prices
+
+        return prices
+
+    @staticmethod
+    def _parse_first_market_prices(event_data: dict[str, Any]) -> Optional[list[float]]:
+        """Extract outcome prices of the first market from event data."""
+        markets = event_data.get("markets") or []
+        if not markets:
+            return None
+
+        prices_raw = markets[0].get("outcomePrices")
+        try:
+            if isinstance(prices_raw, str):
+                prices_raw = json.loads(prices_raw)
+            prices = [float(price) for price in prices_raw]
+        except (json.JSONDecodeError, TypeError, ValueError):
+            return None
+        return prices or None
+
+    async def fetch_recent_events(
+        self, limit: int = 20, max_stale: float = RECENT_EVENTS_CACHE_TTL
+    ) -> list[dict[str, Any]]:
+        """
+        Fetch recent active events sorted by creation date.
+
+        The list is shared between callers for up to ``max_stale`` seconds,
+        pass ``max_stale=0`` to always hit the API.
+        """
+        if self._recent_cache and max_stale > 0:
+            fetched_at, cached_limit, events = self._recent_cache
+            age = time.monotonic() - fetched_at
+
+            if age < max_stale and cached_limit >= limit:
+                # Refresh ahead of expiry so the next caller doesn't wait on the API
+                if age > max_stale * 0.8:
+                    self._schedule_recent_refresh(cached_limit)
+                return events[:limit]
+
+        return await self._refresh_recent_events(limit)
+
+    def _schedule_recent_refresh(self, limit: int) -> None:
+        """Start a background refresh of recent events if none is running."""
+        if self._recent_refresh and not self._recent_refresh.done():
+            return
+        self._recent_refresh = asyncio.create_task(self._refresh_recent_events(limit))
+
+    async def _refresh_recent_events(self, limit: int) -> list[dict[str, Any]]:
+        """Fetch recent events from the API and update the cache."""
         client = await self._get_client()
         url = f"{self.api_url}/events"
         params = {
@@ -60,9 +155,18 @@ class PolymarketService:
             "ascending": "false",
         }
 
-        result = await client.get(url, params=params, timeout=15)
+        # Revalidate the cached list instead of downloading it again
+        cached = self._recent_cache
+        if cached and cached[1] != limit:
+            cached = None
+        result = await client.get(url, params=params, timeout=15, conditional=cached is not None)
+
+        if result is NOT_MODIFIED and cached:
+            self._recent_cache = (time.monotonic(), limit, cached[2])
+            return cached[2]
 
         if isinstance(result, list):
+            self._recent_cache = (time.monotonic(), limit, result)
             return result
 
         logger.warning("Failed to fetch recent events")
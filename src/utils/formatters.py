@@ -1,20 +1,37 @@
 """Formatting utilities for messages and data."""
 
-import json
 import logging
+import math
+from collections.abc import Sequence
 from datetime import datetime
-from typing import Any
+from functools import lru_cache
+from typing import Any, cast
+
+import orjson
 
 logger = logging.getLogger(__name__)
 
+# Static label prefixes of the format_event header
+_LINK_PREFIX = "<b>Link:</b> https://polymarket.com/event/"
+_STATS_LABEL = "<b>Market stats:</b>"
+_CLOSES_PREFIX = "<b>Closes:</b> "
+_LIQUIDITY_PREFIX = "<b>Total Liquidity:</b> "
+_VOLUME_PREFIX = "<b>Total Volume:</b> "
+
 
 def format_money(value: float | int | str | None) -> str:
     """Format money value to readable string."""
-    try:
-        num = float(value) if value else 0
-        return f"${num:,.0f}"
-    except (ValueError, TypeError):
-        return "$0"
+    if isinstance(value, int):
+        return f"${value:,}"
+    if not isinstance(value, float):
+        if not value:
+            return "$0"
+        try:
+            value = float(value)
+        except (ValueError, TypeError):
+            return "$0"
+    # Integer grouping is cheaper than float formatting; nan/inf keep the old output
+    return f"${round(value):,}" if math.isfinite(value) else f"${value:,.0f}"
 
 
 def format_date(date_str: str | None) -> str:
@@ -22,48 +39,56 @@ def format_date(date_str: str | None) -> str:
     if not date_str:
         return "N/A"
     try:
-        dt = datetime.fromisoformat(date_str.replace("Z", "+00:00"))
+        dt = datetime.fromisoformat(date_str)
         return dt.strftime("%B %d, %Y at %H:%M UTC")
     except (ValueError, AttributeError):
         return date_str or "N/A"
 
 
+def _safe_float(value: Any) -> float:
+    """Convert value to float, treating empty or invalid values as 0."""
+    try:
+        return float(value or 0)
+    except (ValueError, TypeError):
+        return 0.0
+
+
 def _calculate_totals(markets: list[dict[str, Any]]) -> tuple[float, float]:
     """Calculate total liquidity and volume from markets."""
-    total_liquidity = 0.0
-    total_volume = 0.0
-
-    for market in markets:
-        try:
-            liquidity = float(market.get("liquidityNum", market.get("liquidity", 0)) or 0)
-            total_liquidity += liquidity
-        except (ValueError, TypeError):
-            pass
+    total_liquidity = sum(
+        (_safe_float(m.get("liquidityNum", m.get("liquidity", 0))) for m in markets), 0.0
+    )
+    total_volume = sum((_safe_float(m.get("volumeNum", m.get("volume", 0))) for m in markets), 0.0)
+    return total_liquidity, total_volume
 
-        try:
-            volume = float(market.get("volumeNum", market.get("volume", 0)) or 0)
-            total_volume += volume
-        except (ValueError, TypeError):
-            pass
 
-    return total_liquidity, total_volume
+@lru_cache(maxsize=4096)
+def _parse_json_cached(value: str) -> tuple[Any, ...]:
+    """Parse a JSON array string once; repeat renders of the same event hit the cache."""
+    try:
+        parsed = orjson.loads(value)
+    except orjson.JSONDecodeError:
+        return ()
+    return tuple(parsed) if isinstance(parsed, list) else ()
 
 
-def _parse_json_field(value: Any) -> list[Any]:
+def _parse_json_field(value: Any) -> Sequence[Any]:
     """Parse JSON field that might be string or already parsed."""
-    if isinstance(value, str):
-        try:
-            return json.loads(value)
-        except json.JSONDecodeError:
-            return []
-    return value if isinstance(value, list) else []
+    value_type = type(value)
+    if value_type is list:
+        # Exact type check (faster than isinstance) doesn't narrow for mypy
+        return cast(list[Any], value)
+    if value_type is str:
+        return _parse_json_cached(value)
+    return []
 
 
 def format_event(event_data: dict[str, Any]) -> str:
     """Format event data to HTML message for Telegram."""
     try:
-        title = event_data.get("title", "Unknown Event")
-        slug = event_data.get("slug", "")
+        # str() keeps the f-string rendering of null values ("None")
+        title = str(event_data.get("title", "Unknown Event"))
+        slug = str(event_data.get("slug", ""))
         markets = event_data.get("markets", [])
 
         if not markets:
@@ -87,12 +112,12 @@ def format_event(event_data: dict[str, Any]) -> str:
 
         # Build message
         lines = [
-            f"<b>{title}</b>\n",
-            f"<b>Link:</b> https://polymarket.com/event/{slug}\n",
-            f"<b>Market stats:</b>",
-            f"<b>Closes:</b> {formatted_date}",
-            f"<b>Total Liquidity:</b> {format_money(total_liquidity)}",
-            f"<b>Total Volume:</b> {format_money(total_volume)}\n",
+            "<b>" + title + "</b>\n",
+            _LINK_PREFIX + slug + "\n",
+            _STATS_LABEL,
+            _CLOSES_PREFIX + formatted_date,
+            _LIQUIDITY_PREFIX + format_money(total_liquidity),
+            _VOLUME_PREFIX + format_money(total_volume) + "\n",
         ]
 
         # Format outcomes
@@ -138,29 +163,25 @@ def _format_multiple_markets(markets: list[dict[str, Any]]) -> list[str]:
     """Format multiple markets."""
     lines = []
 
-    # Filter markets with valid data
+    # Filter markets with valid data, keeping the parsed fields
     valid_markets = []
     for market in markets:
         market_outcomes = _parse_json_field(market.get("outcomes", []))
         market_prices = _parse_json_field(market.get("outcomePrices", []))
         if market_outcomes and market_prices:
-            valid_markets.append(market)
+            valid_markets.append((market, market_outcomes, market_prices))
 
     lines.append(f"<b>Markets ({len(valid_markets)}):</b>")
 
-    for idx, market in enumerate(valid_markets, 1):
+    for idx, (market, market_outcomes, market_prices) in enumerate(valid_markets, 1):
         question = market.get("question", f"Market {idx}")
         lines.append(f"  {idx}. {question}")
 
-        market_outcomes = _parse_json_field(market.get("outcomes", []))
-        market_prices = _parse_json_field(market.get("outcomePrices", []))
-
-        if market_outcomes and market_prices:
-            for o_idx, outcome in enumerate(market_outcomes[:5]):
-                o_name = outcome.get("name", outcome) if isinstance(outcome, dict) else outcome
-                if o_idx < len(market_prices):
-                    o_price = float(market_prices[o_idx])
-                    o_percentage = o_price * 100 if o_price <= 1 else o_price
-                    lines.append(f"     • {o_name}: {o_percentage:.1f}%")
+        for o_idx, outcome in enumerate(market_outcomes[:5]):
+            o_name = outcome.get("name", outcome) if isinstance(outcome, dict) else outcome
+            if o_idx < len(market_prices):
+                o_price = float(market_prices[o_idx])
+                o_percentage = o_price * 100 if o_price <= 1 else o_price
+                lines.append(f"     • {o_name}: {o_percentage:.1f}%")
 
     return lines
@@ -2,18 +2,64 @@
 
 import hashlib
 import re
+from functools import lru_cache
 from typing import Any
 
 from src.config.constants import CATEGORY_KEYWORDS
 
+_EVENT_URL_MARKER = "polymarket.com/event/"
+_SLUG_PREFIX_RE = re.compile(r"[a-zA-Z0-9\-]+")
+# Time references that change frequently and common filler words, removed in one pass
+_NORMALIZE_RE = re.compile(
+    r"\b(?:today|yesterday|this week|last week|recently|currently"
+    r"|the|a|an|is|are|was|were|has|have|had|been|being)\b"
+)
+# One alternation per category so each event text is scanned once per category
+_CATEGORY_RES = {
+    category: re.compile("|".join(map(re.escape, keywords)))
+    for category, keywords in CATEGORY_KEYWORDS.items()
+}
+
 
 def parse_polymarket_url(url: str) -> str | None:
     """Extract event slug from Polymarket URL."""
-    pattern = r"polymarket\.com/event/([a-zA-Z0-9\-]+)"
-    match = re.search(pattern, url)
-    if match:
-        return match.group(1)
-    return None
+    _, marker, tail = url.partition(_EVENT_URL_MARKER)
+    if not marker:
+        return None
+    # The slug runs up to the first character that can't be part of it ("/", "?", "#", ...)
+    match = _SLUG_PREFIX_RE.match(tail)
+    return match.group() if match else None
+
+
+def searchable_text(event_data: dict[str, Any]) -> str:
+    """Lowercased event title and market questions used for filter matching."""
+    markets = event_data.get("markets", [])
+    market_text = " ".join(m.get("question", "") for m in markets)
+    return f"{event_data.get('title', '')} {market_text}".lower()
+
+
+def matching_categories(searchable: str) -> list[str]:
+    """Categories whose keywords appear in an event's searchable text."""
+    return [category for category, pattern in _CATEGORY_RES.items() if pattern.search(searchable)]
+
+
+@lru_cache(maxsize=4096)
+def _keywords_re(keywords: tuple[str, ...]) -> re.Pattern[str] | None:
+    """Compile a user's keywords into one substring alternation (cached per sorted tuple)."""
+    terms = []
+    for keyword in keywords:
+        keyword = keyword.strip()
+        if not keyword:
+            continue
+
+        # Phrases (quoted) are matched without their quotes
+        if (keyword.startswith('"') and keyword.endswith('"')) or (
+            keyword.startswith("'") and keyword.endswith("'")
+        ):
+            keyword = keyword[1:-1]
+        terms.append(re.escape(keyword.lower()))
+
+    return re.compile("|".join(terms)) if terms else None
 
 
 def matches_keywords(event_data: dict[str, Any], keywords: list[str]) -> bool:
@@ -32,30 +78,8 @@ def matches_keywords(event_data: dict[str, Any], keywords: list[str]) -> bool:
     if not keywords:
         return True  # No filters = show all events
 
-    title = event_data.get("title", "").lower()
-    markets = event_data.get("markets", [])
-    market_text = " ".join([m.get("question", "").lower() for m in markets])
-    searchable = f"{title} {market_text}"
-
-    for keyword in keywords:
-        keyword = keyword.strip()
-        if not keyword:
-            continue
-
-        # Check if it's a phrase (has quotes)
-        if (keyword.startswith('"') and keyword.endswith('"')) or (
-            keyword.startswith("'") and keyword.endswith("'")
-        ):
-            # Phrase matching - remove quotes
-            phrase = keyword[1:-1].lower()
-            if phrase in searchable:
-                return True
-        else:
-            # Simple word matching
-            if keyword.lower() in searchable:
-                return True
-
-    return False
+    pattern = _keywords_re(tuple(sorted(keywords)))
+    return pattern is not None and pattern.search(searchable_text(event_data)) is not None
 
 
 def matches_category(event_data: dict[str, Any], user_categories: list[str]) -> bool:
@@ -69,16 +93,12 @@ def matches_category(event_data: dict[str, Any], user_categories: list[str]) ->
     if not user_categories:
         return True  # No filters = show all
 
-    title = event_data.get("title", "").lower()
-    markets = event_data.get("markets", [])
-    market_text = " ".join([m.get("question", "").lower() for m in markets])
-    searchable = f"{title} {market_text}"
+    searchable = searchable_text(event_data)
 
     for category in user_categories:
-        keywords = CATEGORY_KEYWORDS.get(category.lower(), [])
-        for keyword in keywords:
-            if keyword in searchable:
-                return True
+        pattern = _CATEGORY_RES.get(category.lower())
+        if pattern and pattern.search(searchable):
+            return True
 
     return False
 
@@ -88,31 +108,24 @@ def hash_context(context: str) -> str:
     Create hash of context for comparison.
 
     Normalizes the text to reduce false positives from minor variations.
+    Only the first 400 chars are normalized, leaving room for filler removal
+    before the 200-char cut, so text past that point never affects the hash.
     """
     # Normalize: lowercase, remove extra whitespace
-    normalized = " ".join(context.lower().split())
-
-    # Remove time references that change frequently
-    normalized = re.sub(
-        r"\b(today|yesterday|this week|last week|recently|currently)\b", "", normalized
-    )
-
-    # Remove common filler words
-    normalized = re.sub(r"\b(the|a|an|is|are|was|were|has|have|had|been|being)\b", "", normalized)
+    normalized = " ".join(context[:400].lower().split())
 
-    # Keep only first 200 chars for comparison (main content)
-    normalized = normalized[:200]
+    # Remove time references and common filler words, keep only the main content
+    normalized = _NORMALIZE_RE.sub("", normalized)[:200]
 
-    return hashlib.md5(normalized.encode()).hexdigest()
+    return hashlib.blake2b(normalized.encode("utf-8"), digest_size=16).hexdigest()
 
 
 def get_event_category(event_data: dict[str, Any]) -> str:
     """Determine event's primary category."""
     title = (event_data.get("title", "") or event_data.get("question", "")).lower()
 
-    for category, keywords in CATEGORY_KEYWORDS.items():
-        for keyword in keywords:
-            if keyword in title:
-                return category.capitalize()
+    for category, pattern in _CATEGORY_RES.items():
+        if pattern.search(title):
+            return category.capitalize()
 
     return "Other"
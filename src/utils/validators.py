@@ -1,15 +1,59 @@
 """Input validators using Pydantic."""
 
 import re
-from typing import List
-
-from pydantic import BaseModel, Field, field_validator
+from typing import Annotated, Any, List
+
+from pydantic import (
+    BaseModel,
+    Field,
+    StringConstraints,
+    ValidationError,
+    ValidatorFunctionWrapHandler,
+    WrapValidator,
+    field_validator,
+)
+from pydantic_core import PydanticCustomError
 
 from src.config.constants import (
     AVAILABLE_CATEGORIES,
     MAX_KEYWORD_LENGTH,
     MAX_KEYWORDS,
 )
+from src.utils.helpers import parse_polymarket_url
+
+# Punctuation allowed in keywords besides letters, digits and whitespace
+_KW_PUNCT = frozenset("_-\"'")
+_CATEGORY_SET = frozenset(AVAILABLE_CATEGORIES)
+_SLUG_RE = re.compile(r"^[a-zA-Z0-9\-]+$")
+# Quoted phrase, or an unquoted token starting at its first non-space character
+_KW_SPLIT_RE = re.compile(r'"[^"]+"|\'[^\']+\'|[^,\s][^,]*')
+
+
+def _readable_slug_error(value: Any, handler: ValidatorFunctionWrapHandler) -> str:
+    """Replace pydantic's regex mismatch message with one fit to show users."""
+    try:
+        slug: str = handler(value)
+    except ValidationError as e:
+        if any(error["type"] == "string_pattern_mismatch" for error in e.errors()):
+            raise PydanticCustomError(
+                "slug_format", "Invalid slug format (use alphanumeric and hyphens only)"
+            ) from None
+        raise
+    return slug
+
+
+# Event slug: alphanumeric and hyphens, validated and lowercased by pydantic-core
+EventSlug = Annotated[
+    str,
+    StringConstraints(
+        strip_whitespace=True,
+        to_lower=True,
+        min_length=3,
+        max_length=200,
+        pattern=r"^[a-zA-Z0-9-]+$",
+    ),
+    WrapValidator(_readable_slug_error),
+]
 
 
 class KeywordsInput(BaseModel):
@@ -30,7 +74,10 @@ class KeywordsInput(BaseModel):
             if len(keyword) < 2:
                 raise ValueError("Keyword too short (min 2 chars)")
             # Allow alphanumeric, spaces, quotes, and hyphens
-            if not re.match(r'^[\w\s\-"\'\u0400-\u04FF]+$', keyword, re.UNICODE):
+            if not all(
+                ch.isalnum() or ch.isspace() or ch in _KW_PUNCT or "\u0400" <= ch <= "\u04ff"
+                for ch in keyword
+            ):
                 raise ValueError("Invalid characters in keyword")
             validated.append(keyword.lower())
         return validated
@@ -39,20 +86,11 @@ class KeywordsInput(BaseModel):
 class AlertInput(BaseModel):
     """Validator for price alert input."""
 
-    event_slug: str = Field(min_length=3, max_length=200)
+    event_slug: EventSlug
     condition: str = Field(pattern=r"^[<>]$")
     threshold: float = Field(ge=0, le=100)
     outcome_index: int = Field(default=0, ge=0)
 
-    @field_validator("event_slug")
-    @classmethod
-    def validate_slug(cls, v: str) -> str:
-        v = v.strip()
-        # Allow alphanumeric and hyphens
-        if not re.match(r"^[a-zA-Z0-9\-]+$", v):
-            raise ValueError("Invalid slug format (use alphanumeric and hyphens only)")
-        return v.lower()
-
 
 class CategoriesInput(BaseModel):
     """Validator for category filters input."""
@@ -62,11 +100,7 @@ class CategoriesInput(BaseModel):
     @field_validator("categories")
     @classmethod
     def validate_categories(cls, v: List[str]) -> List[str]:
-        validated = []
-        for cat in v:
-            cat = cat.strip().lower()
-            if cat and cat in AVAILABLE_CATEGORIES:
-                validated.append(cat)
+        validated = [cat for raw in v if (cat := raw.strip().lower()) in _CATEGORY_SET]
         if not validated:
             raise ValueError(f"Invalid categories. Available: {', '.join(AVAILABLE_CATEGORIES)}")
         return validated
@@ -81,43 +115,23 @@ class IntervalInput(BaseModel):
 class WatchInput(BaseModel):
     """Validator for watchlist input."""
 
-    event_slug: str = Field(min_length=3, max_length=200)
-
-    @field_validator("event_slug")
-    @classmethod
-    def validate_slug(cls, v: str) -> str:
-        v = v.strip()
-        # Allow alphanumeric and hyphens
-        if not re.match(r"^[a-zA-Z0-9\-]+$", v):
-            raise ValueError("Invalid slug format")
-        return v.lower()
+    event_slug: EventSlug
 
 
 def parse_keywords(input_text: str) -> List[str]:
     """Parse comma-separated keywords, handling quoted phrases."""
-    keywords = []
-    # Split by comma, but preserve quoted strings
-    pattern = r'"[^"]+"|\'[^\']+\'|[^,]+'
-    matches = re.findall(pattern, input_text)
-
-    for match in matches:
-        keyword = match.strip()
-        if keyword:
-            keywords.append(keyword)
-
-    return keywords
+    return [keyword for match in _KW_SPLIT_RE.findall(input_text) if (keyword := match.strip())]
 
 
 def validate_polymarket_url(url: str) -> str | None:
     """Validate and extract slug from Polymarket URL."""
-    pattern = r"polymarket\.com/event/([a-zA-Z0-9\-]+)"
-    match = re.search(pattern, url)
-    if match:
-        return match.group(1).lower()
-
-    # Try treating input as slug directly
     url = url.strip()
-    if re.match(r"^[a-zA-Z0-9\-]+$", url) and len(url) >= 3:
+    if len(url) < 3:
+        return None
+
+    # Bare slug (the common case) needs no URL parsing
+    if _SLUG_RE.match(url):
         return url.lower()
 
-    return None
+    slug = parse_polymarket_url(url)
+    return slug.lower() if slug else None
@@ -1,12 +1,22 @@
 """Pytest fixtures for tests."""
 
 import asyncio
-from typing import AsyncGenerator
+import hashlib
+import os
+import tempfile
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, AsyncGenerator
 
 import pytest
 import pytest_asyncio
 
-from src.database import DatabaseManager, Repository
+# SQLAlchemy and aiosqlite are imported inside the fixtures that need them, so test
+# modules that never touch the database collect without paying for those imports.
+if TYPE_CHECKING:
+    from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
+
+    from src.config.settings import Settings
+    from src.database import DatabaseManager, Repository
 
 
 @pytest.fixture(scope="session")
@@ -17,17 +27,140 @@ def event_loop():
     loop.close()
 
 
-@pytest_asyncio.fixture
-async def db() -> AsyncGenerator[DatabaseManager, None]:
-    """Create in-memory database for testing."""
-    db = DatabaseManager("sqlite+aiosqlite:///:memory:")
-    await db.init_db()
+# Modules whose get_settings() the settings fixture replaces
+_SETTINGS_CONSUMERS = ("src.services.polymarket", "src.services.alert_monitor")
+
+
+@pytest.fixture
+def settings(monkeypatch: pytest.MonkeyPatch) -> "Settings":
+    """Default settings with dummy secrets, so services build without a .env or env vars."""
+    from src.config.settings import Settings
+
+    test_settings = Settings(_env_file=None, bot_token="test-token", api_secret_key="k" * 32)
+    for module in _SETTINGS_CONSUMERS:
+        monkeypatch.setattr(f"{module}.get_settings", lambda: test_settings)
+    return test_settings
+
+
+def _enable_savepoints(engine: "AsyncEngine") -> None:
+    """Let SQLAlchemy manage SQLite transactions so SAVEPOINTs work with aiosqlite."""
+    from sqlalchemy import event
+
+    @event.listens_for(engine.sync_engine, "connect")
+    def _on_connect(dbapi_conn: Any, _record: Any) -> None:
+        dbapi_conn.isolation_level = None
+
+    @event.listens_for(engine.sync_engine, "begin")
+    def _on_begin(conn: Any) -> None:
+        conn.exec_driver_sql("BEGIN")
+
+
+# Named shared-cache in-memory database, reachable from every connection of the engine.
+# Each xdist worker gets its own database.
+_WORKER = os.environ.get("PYTEST_XDIST_WORKER", "gw0")
+TEST_DATABASE_URL = f"sqlite+aiosqlite:///file:polyd_{_WORKER}?mode=memory&cache=shared&uri=true"
+
+
+# Keep test writes in RAM; never applied to file databases
+_MEMORY_DB_PRAGMAS = (
+    "PRAGMA journal_mode=MEMORY",
+    "PRAGMA synchronous=OFF",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA cache_size=-64000",
+    "PRAGMA locking_mode=EXCLUSIVE",
+)
+
+
+def _apply_memory_pragmas(engine: "AsyncEngine") -> None:
+    """Apply the speed-over-durability PRAGMAs to every new connection."""
+    from sqlalchemy import event
+
+    @event.listens_for(engine.sync_engine, "connect")
+    def _on_connect(dbapi_conn: Any, _record: Any) -> None:
+        cursor = dbapi_conn.cursor()
+        for pragma in _MEMORY_DB_PRAGMAS:
+            cursor.execute(pragma)
+        cursor.close()
+
+
+def _schema_hash() -> str:
+    """Hash of the SQLite DDL for the current models."""
+    from sqlalchemy.dialects import sqlite
+    from sqlalchemy.schema import CreateIndex, CreateTable
+
+    from src.database.models import Base
+
+    dialect = sqlite.dialect()
+    ddl = []
+    for table in Base.metadata.sorted_tables:
+        ddl.append(str(CreateTable(table).compile(dialect=dialect)))
+        ddl.extend(str(CreateIndex(index).compile(dialect=dialect)) for index in table.indexes)
+    return hashlib.sha256("\n".join(ddl).encode()).hexdigest()[:16]
+
+
+@pytest_asyncio.fixture(scope="session")
+async def schema_template() -> Path:
+    """On-disk database holding the schema, built once per schema version and reused across runs."""
+    path = Path(tempfile.gettempdir()) / f"polyd_template_{_schema_hash()}.db"
+    if not path.exists():
+        from src.database import DatabaseManager
+
+        # Build under a worker-specific name so concurrent workers never see a partial file
+        tmp_path = path.with_suffix(f".{_WORKER}.tmp")
+        tmp_path.unlink(missing_ok=True)
+        template = DatabaseManager(f"sqlite+aiosqlite:///{tmp_path}")
+        await template.init_db()
+        await template.close()
+        os.replace(tmp_path, path)
+    return path
+
+
+@pytest_asyncio.fixture(scope="session")
+async def db(schema_template: Path) -> AsyncGenerator["DatabaseManager", None]:
+    """Create one in-memory database, with its schema, for the whole test session."""
+    import aiosqlite
+
+    from src.database import DatabaseManager
+
+    db = DatabaseManager(TEST_DATABASE_URL)
+    _enable_savepoints(db.engine)
+    if db.is_memory:
+        _apply_memory_pragmas(db.engine)
+    # A shared-cache memory database is dropped when its last connection closes
+    keepalive = await db.engine.connect()
+    # Clone the schema from the template instead of re-running the DDL
+    raw = await keepalive.get_raw_connection()
+    async with aiosqlite.connect(schema_template) as source:
+        await source.backup(raw.driver_connection)
     yield db
+    await keepalive.close()
     await db.close()
 
 
 @pytest_asyncio.fixture
-async def repo(db: DatabaseManager) -> AsyncGenerator[Repository, None]:
+async def session(db: "DatabaseManager") -> AsyncGenerator["AsyncSession", None]:
+    """Database session whose changes are rolled back after the test."""
+    async with db.engine.connect() as conn:
+        trans = await conn.begin()
+        session = db.session_factory(bind=conn, join_transaction_mode="create_savepoint")
+        try:
+            yield session
+        finally:
+            await session.close()
+            await trans.rollback()
+
+
+@pytest_asyncio.fixture
+async def repo(session: "AsyncSession") -> "Repository":
     """Create repository with test database session."""
-    async with db.session() as session:
-        yield Repository(session)
+    from src.database import Repository
+
+    return Repository(session)
+
+
+@pytest_asyncio.fixture
+async def user_repo(repo: "Repository") -> "Repository":
+    """Repository whose database already holds the test user 123456."""
+    await repo.create_user(123456)
+    await repo.session.flush()
+    return repo
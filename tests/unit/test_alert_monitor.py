@@ -0,0 +1,129 @@
+"""Tests for the price alert monitor."""
+
+import asyncio
+import time
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+
+from src.services.alert_monitor import AlertMonitorService
+
+
+@pytest.fixture
+def monitor(settings) -> AlertMonitorService:  # noqa: ARG001 - setup only
+    """Alert monitor with stubbed database, Polymarket client and notifier."""
+    return AlertMonitorService(db=Mock(), polymarket=Mock(), send_notification=AsyncMock())
+
+
+def make_alert(condition: str, threshold: float, outcome_index: int = 0) -> SimpleNamespace:
+    """Active price alert on btc-price-2025."""
+    return SimpleNamespace(
+        id=1,
+        event_slug="btc-price-2025",
+        condition=condition,
+        threshold=threshold,
+        outcome_index=outcome_index,
+    )
+
+
+@pytest.mark.asyncio
+class TestCheckSingleAlert:
+    """Tests for checking one alert against an event's outcome prices."""
+
+    async def test_second_outcome_triggers(self, monitor: AlertMonitorService):
+        """Test an alert on outcome_index 1 compares that outcome's price."""
+        repo = AsyncMock()
+        alert = make_alert(">", 60.0, outcome_index=1)
+
+        await monitor._check_single_alert(repo, 123456, alert, [0.3, 0.7])
+
+        repo.mark_alert_triggered.assert_awaited_once_with(1)
+        monitor.send_notification.assert_awaited_once()
+        telegram_id, message = monitor.send_notification.await_args.args
+        assert telegram_id == 123456
+        assert "70.0%" in message
+
+    async def test_first_outcome_not_triggered(self, monitor: AlertMonitorService):
+        """Test the same prices leave an alert on outcome_index 0 untriggered."""
+        repo = AsyncMock()
+
+        await monitor._check_single_alert(repo, 123456, make_alert(">", 60.0), [0.3, 0.7])
+
+        repo.mark_alert_triggered.assert_not_awaited()
+        monitor.send_notification.assert_not_awaited()
+
+    async def test_out_of_range_outcome_skipped(self, monitor: AlertMonitorService):
+        """Test an outcome index past the event's prices is skipped without error."""
+        repo = AsyncMock()
+        alert = make_alert("<", 100.0, outcome_index=2)
+
+        await monitor._check_single_alert(repo, 123456, alert, [0.3, 0.7])
+
+        repo.mark_alert_triggered.assert_not_awaited()
+        monitor.send_notification.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+class TestAlertNotifications:
+    """Tests for waking the monitor on alert changes."""
+
+    async def test_changed_slug_checked_without_full_check(self, monitor: AlertMonitorService):
+        """Test a changed slug is checked on its own and the full check is not pushed back."""
+        monitor._check_alerts = AsyncMock()
+        next_full_check = time.monotonic() + 60
+        monitor._next_full_check = next_full_check
+
+        monitor._on_alert_changed("btc-price-2025")
+        assert monitor._wake.is_set()
+        await monitor._tick()
+
+        monitor._check_alerts.assert_awaited_once_with({"btc-price-2025"})
+        assert monitor._next_full_check == next_full_check
+        assert not monitor._changed_slugs
+
+    async def test_change_wakes_running_loop(self, monitor: AlertMonitorService):
+        """Test a notification makes the running loop check the slug before the interval."""
+        checked = asyncio.Event()
+        monitor._check_alerts = AsyncMock(side_effect=lambda *_: checked.set())
+        monitor.db.listen_alerts = AsyncMock(return_value=None)
+
+        await monitor.start()
+        try:
+            monitor._on_alert_changed("btc-price-2025")
+            await asyncio.wait_for(checked.wait(), timeout=1)
+        finally:
+            await monitor.stop()
+
+        monitor._check_alerts.assert_awaited_once_with({"btc-price-2025"})
+
+    async def test_due_full_check_clears_changed_slugs(self, monitor: AlertMonitorService):
+        """Test a due full check covers pending slugs and schedules the next one."""
+        monitor._check_alerts = AsyncMock()
+        monitor._next_full_check = time.monotonic() - 1
+        monitor._changed_slugs = {"btc-price-2025"}
+
+        await monitor._tick()
+
+        monitor._check_alerts.assert_awaited_once_with()
+        assert not monitor._changed_slugs
+        assert monitor._next_full_check > time.monotonic()
+
+    async def test_listen_failure_falls_back_to_polling(self, monitor: AlertMonitorService):
+        """Test the monitor keeps polling when listening for changes fails."""
+        monitor.db.listen_alerts = AsyncMock(side_effect=OSError("connection refused"))
+
+        await monitor._on_start()
+
+        assert monitor._unlisten is None
+
+    async def test_listener_removed_on_stop(self, monitor: AlertMonitorService):
+        """Test a registered listener is removed when the monitor stops."""
+        unlisten = AsyncMock()
+        monitor.db.listen_alerts = AsyncMock(return_value=unlisten)
+
+        await monitor._on_start()
+        await monitor._on_stop()
+
+        unlisten.assert_awaited_once_with()
+        assert monitor._unlisten is None
@@ -0,0 +1,116 @@
+"""Tests for formatting functions."""
+
+import pytest
+
+from src.utils.formatters import format_date, format_event, format_money
+
+
+class TestFormatMoney:
+    """Tests for format_money function."""
+
+    def test_number(self):
+        """Test numeric values get thousands separators."""
+        assert format_money(1234567) == "$1,234,567"
+
+    def test_float_rounded(self):
+        """Test floats are rounded to whole dollars."""
+        assert format_money(1234.6) == "$1,235"
+        assert format_money(0.4) == "$0"
+
+    def test_numeric_string(self):
+        """Test numeric strings are accepted."""
+        assert format_money("2500") == "$2,500"
+
+    def test_invalid(self):
+        """Test empty and invalid values."""
+        assert format_money(None) == "$0"
+        assert format_money("abc") == "$0"
+
+
+class TestFormatDate:
+    """Tests for format_date function."""
+
+    def test_utc_suffix(self):
+        """Test ISO dates with a Z suffix."""
+        assert format_date("2025-01-31T12:00:00Z") == "January 31, 2025 at 12:00 UTC"
+
+    def test_missing(self):
+        """Test missing dates."""
+        assert format_date(None) == "N/A"
+
+    def test_invalid_returned_as_is(self):
+        """Test unparseable dates are returned unchanged."""
+        assert format_date("soon") == "soon"
+
+
+class TestFormatEvent:
+    """Tests for format_event function."""
+
+    def test_single_market(self):
+        """Test a binary market shows its odds."""
+        event = {
+            "title": "Will BTC hit $100k?",
+            "slug": "btc-100k",
+            "volume": 1000,
+            "liquidity": 500,
+            "markets": [{"outcomes": '["Yes", "No"]', "outcomePrices": '["0.65", "0.35"]'}],
+        }
+        text = format_event(event)
+        assert "https://polymarket.com/event/btc-100k" in text
+        assert "Yes: 65.0%" in text
+        assert "No: 35.0%" in text
+
+    @pytest.mark.parametrize(
+        ("event_title", "header"),
+        [(None, "<b>None</b>"), ("", "<b></b>")],
+        ids=["null-title", "empty-title"],
+    )
+    def test_title_rendered_as_given(self, event_title, header):
+        """Test null and empty titles render as before, without the missing-title fallback."""
+        event = {
+            "title": event_title,
+            "slug": "btc-100k",
+            "markets": [{"outcomes": '["Yes", "No"]', "outcomePrices": '["0.65", "0.35"]'}],
+        }
+        assert format_event(event).startswith(header)
+
+    def test_missing_title_fallback(self):
+        """Test an event without a title key is shown as Unknown Event."""
+        event = {"markets": [{"outcomes": '["Yes", "No"]', "outcomePrices": '["0.65", "0.35"]'}]}
+        assert format_event(event).startswith("<b>Unknown Event</b>")
+
+    def test_multiple_markets_skips_invalid(self):
+        """Test markets without outcomes or prices are left out."""
+        event = {
+            "title": "Election",
+            "slug": "election",
+            "markets": [
+                {
+                    "question": "Candidate A?",
+                    "outcomes": '["Yes", "No"]',
+                    "outcomePrices": "[0.4, 0.6]",
+                },
+                {"question": "Candidate B?", "outcomes": "[]", "outcomePrices": "[]"},
+            ],
+        }
+        text = format_event(event)
+        assert "<b>Markets (1):</b>" in text
+        assert "1. Candidate A?" in text
+        assert "Candidate B?" not in text
+
+    def test_no_markets(self):
+        """Test events without markets."""
+        assert format_event({"title": "Empty"}) == "No market data available"
+
+    def test_totals_from_markets(self):
+        """Test totals are summed from markets when the event has none."""
+        event = {
+            "title": "Totals",
+            "markets": [
+                {"liquidityNum": 1000, "volume": "2500", "outcomes": "[]"},
+                {"liquidity": "bad", "volumeNum": None, "outcomes": "[]"},
+            ],
+        }
+        text = format_event(event)
+        assert "<b>Total Liquidity:</b> $1,000" in text
+        assert "<b>Total Volume:</b> $2,500" in text
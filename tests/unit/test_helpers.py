@@ -137,6 +137,11 @@ class TestParsePolymarketUrl:
         url = "https://polymarket.com/event/btc-price-2025?tab=comments"
         assert parse_polymarket_url(url) == "btc-price-2025"
 
+    def test_url_with_market_path(self):
+        """Test URL with a trailing market path."""
+        url = "https://polymarket.com/event/btc-price-2025/will-btc-hit-100k"
+        assert parse_polymarket_url(url) == "btc-price-2025"
+
     def test_invalid_url(self):
         """Test invalid URL returns None."""
         url = "https://example.com/something"
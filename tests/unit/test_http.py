@@ -0,0 +1,69 @@
+"""Tests for conditional GETs in the HTTP client and recent-events cache."""
+
+from collections.abc import AsyncIterator
+
+import pytest
+import pytest_asyncio
+from aiohttp import web
+from aiohttp.test_utils import TestServer as AiohttpServer
+
+from src.services.polymarket import PolymarketService
+from src.utils.http import NOT_MODIFIED, HttpClient
+
+EVENTS = [{"id": "1", "title": "Test Event"}]
+ETAG = '"v1"'
+# If-None-Match header of each request the server received
+SEEN_ETAGS = web.AppKey("seen_etags", list[str | None])
+
+
+@pytest_asyncio.fixture
+async def server() -> AsyncIterator[AiohttpServer]:
+    """Events endpoint that answers 200 with an ETag, then 304 once it is sent back."""
+
+    async def events(request: web.Request) -> web.Response:
+        request.app[SEEN_ETAGS].append(request.headers.get("If-None-Match"))
+        if request.headers.get("If-None-Match") == ETAG:
+            return web.Response(status=304)
+        return web.json_response(EVENTS, headers={"ETag": ETAG})
+
+    app = web.Application()
+    app[SEEN_ETAGS] = []
+    app.router.add_get("/events", events)
+    async with AiohttpServer(app) as test_server:
+        yield test_server
+
+
+@pytest.mark.asyncio
+class TestConditionalGet:
+    """Tests for ETag revalidation."""
+
+    async def test_first_response_validators_used_on_next_request(self, server: AiohttpServer):
+        """Test a plain GET records the ETag so the next conditional GET revalidates."""
+        async with HttpClient() as client:
+            url = str(server.make_url("/events"))
+            assert await client.get(url, params={"limit": "20"}) == EVENTS
+            assert await client.get(url, params={"limit": "20"}, conditional=True) is NOT_MODIFIED
+
+        assert server.app[SEEN_ETAGS] == [None, ETAG]
+
+    async def test_validators_are_per_params(self, server: AiohttpServer):
+        """Test validators of one query are not sent with another."""
+        async with HttpClient() as client:
+            url = str(server.make_url("/events"))
+            await client.get(url, params={"limit": "20"})
+            assert await client.get(url, params={"limit": "50"}, conditional=True) == EVENTS
+
+        assert server.app[SEEN_ETAGS] == [None, None]
+
+    @pytest.mark.usefixtures("settings")
+    async def test_recent_events_served_from_cache_on_304(self, server: AiohttpServer):
+        """Test a 304 keeps returning the cached recent events."""
+        service = PolymarketService()
+        service.api_url = str(server.make_url("")).rstrip("/")
+        try:
+            assert await service.fetch_recent_events(limit=20, max_stale=0) == EVENTS
+            assert await service.fetch_recent_events(limit=20, max_stale=0) == EVENTS
+        finally:
+            await service.close()
+
+        assert server.app[SEEN_ETAGS] == [None, ETAG]
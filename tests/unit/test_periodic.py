@@ -0,0 +1,69 @@
+"""Tests for the periodic service base class."""
+
+import asyncio
+
+import pytest
+
+from src.services.periodic import PeriodicService
+
+
+class TickCounter(PeriodicService):
+    """Periodic service that records its ticks."""
+
+    name = "tick counter"
+
+    def __init__(self, check_interval: float = 60) -> None:
+        super().__init__(check_interval)
+        self.ticks = 0
+        self.ticked = asyncio.Event()
+
+    async def _tick(self) -> None:
+        """Count the tick."""
+        self.ticks += 1
+        self.ticked.set()
+
+
+@pytest.mark.asyncio
+class TestPeriodicService:
+    """Tests for waking and stopping the monitoring loop."""
+
+    async def test_wait_times_out(self):
+        """Test _wait returns False when nothing wakes it."""
+        service = TickCounter()
+        assert await service._wait(0) is False
+
+    async def test_notify_now_wakes_wait(self):
+        """Test notify_now ends a long _wait early."""
+        service = TickCounter()
+        waiter = asyncio.create_task(service._wait(60))
+        await asyncio.sleep(0)
+
+        service.notify_now()
+        assert await asyncio.wait_for(waiter, timeout=1) is True
+
+    async def test_notify_now_runs_tick(self):
+        """Test a running loop ticks right after notify_now instead of after the interval."""
+        service = TickCounter()
+        await service.start()
+        try:
+            service.notify_now()
+            await asyncio.wait_for(service.ticked.wait(), timeout=1)
+        finally:
+            await service.stop()
+
+        assert service.ticks == 1
+
+    async def test_stop_cancels_loop(self):
+        """Test stop() cancels the loop task and allows a restart."""
+        service = TickCounter()
+        await service.start()
+        task = service._task
+        assert task is not None
+
+        await service.stop()
+        assert task.cancelled()
+        assert service._task is None
+
+        await service.start()
+        assert service._task is not None
+        await service.stop()
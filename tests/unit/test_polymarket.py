@@ -0,0 +1,180 @@
+"""Tests for Polymarket service caching and price parsing."""
+
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+
+import pytest
+
+from src.config.constants import PRICE_CACHE_TTL, RECENT_EVENTS_CACHE_TTL
+from src.services import polymarket
+from src.services.polymarket import PolymarketService
+
+
+class FakeClock:
+    """Stand-in for the time module with a monotonic clock moved by hand."""
+
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def monotonic(self) -> float:
+        return self.now
+
+    def advance(self, seconds: float) -> None:
+        self.now += seconds
+
+
+@pytest.fixture
+def clock(monkeypatch: pytest.MonkeyPatch) -> FakeClock:
+    """Clock driving the service's cache timestamps."""
+    fake = FakeClock()
+    monkeypatch.setattr(polymarket, "time", SimpleNamespace(monotonic=fake.monotonic))
+    return fake
+
+
+@pytest.fixture
+def service(settings, clock: FakeClock) -> PolymarketService:  # noqa: ARG001 - setup only
+    """Service built from test settings, with cache timestamps from the fake clock."""
+    return PolymarketService()
+
+
+@pytest.fixture
+def client(service: PolymarketService) -> AsyncMock:
+    """HTTP client stub whose GET returns 100 recent events."""
+    stub = AsyncMock()
+    stub.get.return_value = [{"id": str(i)} for i in range(100)]
+    service._http_client = stub
+    return stub
+
+
+def event_with_prices(outcome_prices):
+    """Event payload whose first market has the given outcomePrices."""
+    return {"slug": "btc", "markets": [{"outcomePrices": outcome_prices}]}
+
+
+class TestParseFirstMarketPrices:
+    """Tests for outcome price parsing."""
+
+    @pytest.mark.parametrize(
+        ("outcome_prices", "expected"),
+        [
+            ('["0.6", "0.4"]', [0.6, 0.4]),
+            (["0.25", "0.75"], [0.25, 0.75]),
+            ([0.1, 0.9], [0.1, 0.9]),
+        ],
+        ids=["json-string", "string-list", "number-list"],
+    )
+    def test_valid_prices(self, outcome_prices, expected):
+        """Test prices are read from JSON strings and from lists."""
+        event = event_with_prices(outcome_prices)
+        assert PolymarketService._parse_first_market_prices(event) == expected
+
+    @pytest.mark.parametrize(
+        "event",
+        [
+            {"slug": "btc"},
+            {"slug": "btc", "markets": []},
+            {"slug": "btc", "markets": [{}]},
+            event_with_prices(None),
+            event_with_prices("not json"),
+            event_with_prices('{"yes": 0.5}'),
+            event_with_prices(["yes", "no"]),
+        ],
+        ids=[
+            "no-markets-key",
+            "no-markets",
+            "no-prices",
+            "null-prices",
+            "malformed-json",
+            "json-object",
+            "non-numeric",
+        ],
+    )
+    def test_missing_or_malformed_prices(self, event):
+        """Test unusable outcomePrices yield None instead of raising."""
+        assert PolymarketService._parse_first_market_prices(event) is None
+
+
+@pytest.mark.asyncio
+class TestFetchPrices:
+    """Tests for the per-slug price cache."""
+
+    async def test_cache_hit(self, service: PolymarketService):
+        """Test a second call within the TTL is served from cache."""
+        service.fetch_event_by_slug = AsyncMock(return_value=event_with_prices('["0.6", "0.4"]'))
+
+        assert await service.fetch_prices(["btc"]) == {"btc": [0.6, 0.4]}
+        assert await service.fetch_prices(["btc"]) == {"btc": [0.6, 0.4]}
+        assert service.fetch_event_by_slug.await_count == 1
+
+    async def test_cache_expires_after_ttl(self, service: PolymarketService, clock: FakeClock):
+        """Test prices are fetched again once the TTL has passed."""
+        service.fetch_event_by_slug = AsyncMock(return_value=event_with_prices('["0.6", "0.4"]'))
+        await service.fetch_prices(["btc"])
+
+        service.fetch_event_by_slug.return_value = event_with_prices('["0.7", "0.3"]')
+        clock.advance(PRICE_CACHE_TTL)
+
+        assert await service.fetch_prices(["btc"]) == {"btc": [0.7, 0.3]}
+        assert service.fetch_event_by_slug.await_count == 2
+
+    async def test_unusable_prices_left_out(self, service: PolymarketService):
+        """Test events with malformed prices are omitted and not cached."""
+        service.fetch_event_by_slug = AsyncMock(return_value=event_with_prices("not json"))
+
+        assert await service.fetch_prices(["btc"]) == {}
+        assert await service.fetch_prices(["btc"]) == {}
+        assert service.fetch_event_by_slug.await_count == 2
+
+
+@pytest.mark.asyncio
+class TestFetchRecentEvents:
+    """Tests for the shared recent-events cache."""
+
+    async def test_smaller_limit_sliced_from_cache(
+        self, service: PolymarketService, client: AsyncMock
+    ):
+        """Test a limit=20 call is answered from a fresh limit=100 entry without a request."""
+        await service.fetch_recent_events(limit=100)
+
+        events = await service.fetch_recent_events(limit=20)
+
+        assert events == [{"id": str(i)} for i in range(20)]
+        assert client.get.await_count == 1
+
+    async def test_larger_limit_fetched(self, service: PolymarketService, client: AsyncMock):
+        """Test a cached entry with a smaller limit is not used for a larger one."""
+        await service.fetch_recent_events(limit=20)
+        await service.fetch_recent_events(limit=100)
+        assert client.get.await_count == 2
+
+    async def test_entry_expires_after_ttl(
+        self, service: PolymarketService, client: AsyncMock, clock: FakeClock
+    ):
+        """Test the cache is refetched once the TTL has passed."""
+        await service.fetch_recent_events(limit=100)
+        clock.advance(RECENT_EVENTS_CACHE_TTL)
+
+        await service.fetch_recent_events(limit=20)
+
+        assert client.get.await_count == 2
+        assert client.get.await_args.kwargs["params"]["limit"] == "20"
+
+    async def test_refresh_ahead_scheduled_once(
+        self, service: PolymarketService, client: AsyncMock, clock: FakeClock
+    ):
+        """Test a nearly stale entry is served while a single background refresh updates it."""
+        await service.fetch_recent_events(limit=100)
+        clock.advance(RECENT_EVENTS_CACHE_TTL * 0.9)
+        client.get.return_value = [{"id": "new"}]
+
+        assert len(await service.fetch_recent_events(limit=20)) == 20
+        refresh = service._recent_refresh
+        assert refresh is not None
+        assert len(await service.fetch_recent_events(limit=20)) == 20
+        assert service._recent_refresh is refresh
+
+        await refresh
+        assert client.get.await_count == 2
+        assert client.get.await_args.kwargs["params"]["limit"] == "100"
+        assert await service.fetch_recent_events(limit=20) == [{"id": "new"}]
+        assert client.get.await_count == 2
@@ -1,220 +1,273 @@
 """Tests for database repository."""
 
+import asyncio
+from pathlib import Path
+from unittest.mock import AsyncMock, patch
+
 import pytest
-import pytest_asyncio
 
 from src.database import DatabaseManager, Repository
+from src.utils.helpers import hash_context
 
 
-@pytest_asyncio.fixture
-async def test_db():
-    """Create in-memory database for testing."""
-    db = DatabaseManager("sqlite+aiosqlite:///:memory:")
-    await db.init_db()
-    yield db
-    await db.close()
+@pytest.mark.asyncio
+class TestDatabaseManager:
+    """Tests for the shared test database."""
+
+    async def test_schema_shared_across_sessions(self, db: DatabaseManager):
+        """Test separate sessions see the same in-memory schema."""
+        assert db.is_memory
+        for _ in range(2):
+            async with db.session() as session:
+                assert await Repository(session).get_seen_events_count() == 0
+
+    async def test_listen_alerts_unsupported_on_sqlite(self, db: DatabaseManager):
+        """Test alert notifications are not available on SQLite."""
+        assert await db.listen_alerts(lambda _slug: None) is None
+
+    async def test_close_is_idempotent(self):
+        """Test closing a database twice disposes the engine only once."""
+        db = DatabaseManager("sqlite+aiosqlite:///:memory:")
+        # AsyncEngine uses __slots__, so patch the method on the class
+        with patch.object(type(db.engine), "dispose", new_callable=AsyncMock) as dispose:
+            await db.close()
+            await db.close()
+        assert dispose.await_count == 1
 
 
 @pytest.mark.asyncio
 class TestUserOperations:
     """Tests for user-related repository operations."""
 
-    async def test_create_user(self, test_db: DatabaseManager):
+    async def test_create_user(self, repo: Repository):
         """Test user creation."""
-        async with test_db.session() as session:
-            repo = Repository(session)
-            user = await repo.create_user(123456)
-            assert user.telegram_id == 123456
+        user = await repo.create_user(123456)
+        assert user.telegram_id == 123456
 
-    async def test_get_user(self, test_db: DatabaseManager):
+    async def test_get_user(self, repo: Repository):
         """Test getting user."""
-        async with test_db.session() as session:
-            repo = Repository(session)
-            await repo.create_user(123456)
-            user = await repo.get_user(123456)
-            assert user is not None
-            assert user.telegram_id == 123456
-
-    async def test_get_nonexistent_user(self, test_db: DatabaseManager):
+        await repo.create_user(123456)
+        user = await repo.get_user(123456)
+        assert user is not None
+        assert user.telegram_id == 123456
+
+    async def test_get_nonexistent_user(self, repo: Repository):
         """Test getting nonexistent user."""
-        async with test_db.session() as session:
-            repo = Repository(session)
-            user = await repo.get_user(999999)
-            assert user is None
+        user = await repo.get_user(999999)
+        assert user is None
 
-    async def test_get_or_create_user_new(self, test_db: DatabaseManager):
+    async def test_get_or_create_user_new(self, repo: Repository):
         """Test get_or_create creates new user."""
-        async with test_db.session() as session:
-            repo = Repository(session)
-            user, created = await repo.get_or_create_user(123456)
-            assert created is True
-            assert user.telegram_id == 123456
+        user, created = await repo.get_or_create_user(123456)
+        assert created is True
+        assert user.telegram_id == 123456
 
-    async def test_get_or_create_user_existing(self, test_db: DatabaseManager):
+    async def test_get_or_create_user_existing(self, user_repo: Repository):
         """Test get_or_create returns existing user."""
-        async with test_db.session() as session:
-            repo = Repository(session)
-            await repo.create_user(123456)
-            user, created = await repo.get_or_create_user(123456)
-            assert created is False
+        user, created = await user_repo.get_or_create_user(123456)
+        assert created is False
+        assert user.telegram_id == 123456
 
-    async def test_set_user_paused(self, test_db: DatabaseManager):
+    async def test_set_user_paused(self, user_repo: Repository):
         """Test setting user paused status."""
-        async with test_db.session() as session:
-            repo = Repository(session)
-            await repo.create_user(123456)
-            result = await repo.set_user_paused(123456, True)
-            assert result is True
+        result = await user_repo.set_user_paused(123456, True)
+        assert result is True
 
-            user = await repo.get_user(123456)
-            assert user.is_paused is True
+        user = await user_repo.get_user(123456)
+        assert user.is_paused is True
 
 
 @pytest.mark.asyncio
 class TestKeywordOperations:
     """Tests for keyword-related repository operations."""
 
-    async def test_set_keywords(self, test_db: DatabaseManager):
+    async def test_set_keywords(self, user_repo: Repository):
         """Test setting user keywords."""
-        async with test_db.session() as session:
-            repo = Repository(session)
-            await repo.create_user(123456)
-            result = await repo.set_user_keywords(123456, ["btc", "eth"])
-            assert result is True
+        result = await user_repo.set_user_keywords(123456, ["btc", "eth"])
+        assert result is True
 
-    async def test_get_keywords(self, test_db: DatabaseManager):
+    async def test_get_keywords(self, user_repo: Repository):
         """Test getting user keywords."""
-        async with test_db.session() as session:
-            repo = Repository(session)
-            await repo.create_user(123456)
-            await repo.set_user_keywords(123456, ["btc", "eth"])
-            keywords = await repo.get_user_keywords(123456)
-            assert len(keywords) == 2
-            assert "btc" in keywords
-
-    async def test_clear_keywords(self, test_db: DatabaseManager):
+        await user_repo.set_user_keywords(123456, ["btc", "eth"])
+        await user_repo.session.flush()
+        keywords = await user_repo.get_user_keywords(123456)
+        assert len(keywords) == 2
+        assert "btc" in keywords
+
+    async def test_clear_keywords(self, user_repo: Repository):
         """Test clearing user keywords."""
-        async with test_db.session() as session:
-            repo = Repository(session)
-            await repo.create_user(123456)
-            await repo.set_user_keywords(123456, ["btc", "eth"])
-            await repo.clear_user_keywords(123456)
-            keywords = await repo.get_user_keywords(123456)
-            assert len(keywords) == 0
+        await user_repo.set_user_keywords(123456, ["btc", "eth"])
+        await user_repo.clear_user_keywords(123456)
+        keywords = await user_repo.get_user_keywords(123456)
+        assert len(keywords) == 0
+
+    async def test_find_users_matching_events(self, repo: Repository):
+        """Test keyword and category filters are matched in the database."""
+        for telegram_id in (1, 2, 3, 4):
+            await repo.create_user(telegram_id)
+        await repo.session.flush()
+
+        await repo.set_user_keywords(1, ["bitcoin"])
+        await repo.set_user_keywords(2, ['"united states"'])
+        await repo.set_user_categories(3, ["politics"])
+        await repo.set_user_paused(4, True)
+        await repo.session.flush()
+
+        events = [
+            {"id": "1", "title": "Will Bitcoin reach $100k?", "markets": []},
+            {
+                "id": "2",
+                "title": "Who wins the election?",
+                "markets": [{"question": "Will the United States elect a new president?"}],
+            },
+        ]
+        matches = await repo.find_users_matching_events(events)
+        assert matches == {1: ["1"], 2: ["2"], 3: ["2"]}
 
 
 @pytest.mark.asyncio
 class TestWatchlistOperations:
     """Tests for watchlist-related repository operations."""
 
-    async def test_add_to_watchlist(self, test_db: DatabaseManager):
+    async def test_add_to_watchlist(self, user_repo: Repository):
         """Test adding to watchlist."""
-        async with test_db.session() as session:
-            repo = Repository(session)
-            await repo.create_user(123456)
-            result = await repo.add_to_watchlist(123456, "btc-price-2025")
-            assert result is True
+        result = await user_repo.add_to_watchlist(123456, "btc-price-2025")
+        assert result is True
 
-    async def test_add_duplicate_to_watchlist(self, test_db: DatabaseManager):
+    async def test_add_duplicate_to_watchlist(self, user_repo: Repository):
         """Test adding duplicate to watchlist."""
-        async with test_db.session() as session:
-            repo = Repository(session)
-            await repo.create_user(123456)
-            await repo.add_to_watchlist(123456, "btc-price-2025")
-            result = await repo.add_to_watchlist(123456, "btc-price-2025")
-            assert result is False
-
-    async def test_remove_from_watchlist(self, test_db: DatabaseManager):
+        await user_repo.add_to_watchlist(123456, "btc-price-2025")
+        await user_repo.session.flush()
+        result = await user_repo.add_to_watchlist(123456, "btc-price-2025")
+        assert result is False
+
+    async def test_remove_from_watchlist(self, user_repo: Repository):
         """Test removing from watchlist."""
-        async with test_db.session() as session:
-            repo = Repository(session)
-            await repo.create_user(123456)
-            await repo.add_to_watchlist(123456, "btc-price-2025")
-            result = await repo.remove_from_watchlist(123456, "btc-price-2025")
-            assert result is True
-
-    async def test_get_watchlist(self, test_db: DatabaseManager):
+        await user_repo.add_to_watchlist(123456, "btc-price-2025")
+        await user_repo.session.flush()
+        result = await user_repo.remove_from_watchlist(123456, "btc-price-2025")
+        assert result is True
+
+    async def test_get_watchlist(self, user_repo: Repository):
         """Test getting watchlist."""
-        async with test_db.session() as session:
-            repo = Repository(session)
-            await repo.create_user(123456)
-            await repo.add_to_watchlist(123456, "btc-price-2025")
-            await repo.add_to_watchlist(123456, "eth-price-2025")
-            watchlist = await repo.get_user_watchlist(123456)
-            assert len(watchlist) == 2
+        await user_repo.add_to_watchlist(123456, "btc-price-2025")
+        await user_repo.add_to_watchlist(123456, "eth-price-2025")
+        await user_repo.session.flush()
+        watchlist = await user_repo.get_user_watchlist(123456)
+        assert len(watchlist) == 2
 
 
 @pytest.mark.asyncio
 class TestAlertOperations:
     """Tests for alert-related repository operations."""
 
-    async def test_add_alert(self, test_db: DatabaseManager):
+    async def test_add_alert(self, user_repo: Repository):
         """Test adding price alert."""
-        async with test_db.session() as session:
-            repo = Repository(session)
-            await repo.create_user(123456)
-            result = await repo.add_alert(123456, "btc-price-2025", ">", 70.0)
-            assert result is True
+        result = await user_repo.add_alert(123456, "btc-price-2025", ">", 70.0)
+        assert result is True
 
-    async def test_add_duplicate_alert(self, test_db: DatabaseManager):
+    async def test_add_duplicate_alert(self, user_repo: Repository):
         """Test adding duplicate alert."""
-        async with test_db.session() as session:
-            repo = Repository(session)
-            await repo.create_user(123456)
-            await repo.add_alert(123456, "btc-price-2025", ">", 70.0)
-            result = await repo.add_alert(123456, "btc-price-2025", ">", 70.0)
-            assert result is False
-
-    async def test_get_alerts(self, test_db: DatabaseManager):
+        await user_repo.add_alert(123456, "btc-price-2025", ">", 70.0)
+        await user_repo.session.flush()
+        result = await user_repo.add_alert(123456, "btc-price-2025", ">", 70.0)
+        assert result is False
+
+    async def test_get_alerts(self, user_repo: Repository):
         """Test getting user alerts."""
-        async with test_db.session() as session:
-            repo = Repository(session)
-            await repo.create_user(123456)
-            await repo.add_alert(123456, "btc-price-2025", ">", 70.0)
-            await repo.add_alert(123456, "eth-price-2025", "<", 30.0)
-            alerts = await repo.get_user_alerts(123456)
-            assert len(alerts) == 2
-
-    async def test_remove_alert(self, test_db: DatabaseManager):
+        await user_repo.add_alerts(
+            123456, [("btc-price-2025", ">", 70.0), ("eth-price-2025", "<", 30.0)]
+        )
+        alerts = await user_repo.get_user_alerts(123456)
+        assert len(alerts) == 2
+
+    async def test_add_alerts_skips_duplicates(self, user_repo: Repository):
+        """Test bulk adding ignores alerts the user already has."""
+        items = [("btc-price-2025", ">", 70.0), ("btc-price-2025", ">", 70.0)]
+        assert await user_repo.add_alerts(123456, items) == 1
+        assert await user_repo.add_alerts(999999, items) == 0
+
+    async def test_remove_alert(self, user_repo: Repository):
         """Test removing alert by index."""
-        async with test_db.session() as session:
-            repo = Repository(session)
-            await repo.create_user(123456)
-            await repo.add_alert(123456, "btc-price-2025", ">", 70.0)
-            result = await repo.remove_alert(123456, 0)
-            assert result is True
+        await user_repo.add_alerts(123456, [("btc-price-2025", ">", 70.0)])
+        result = await user_repo.remove_alert(123456, 0)
+        assert result is True
+        await user_repo.session.flush()
+
+        alerts = await user_repo.get_user_alerts(123456)
+        assert len(alerts) == 0
 
-            alerts = await repo.get_user_alerts(123456)
-            assert len(alerts) == 0
+    async def test_get_active_alerts_for_slugs(self, user_repo: Repository):
+        """Test filtering active alerts by event slug."""
+        await user_repo.add_alert(123456, "btc-price-2025", ">", 70.0)
+        await user_repo.add_alert(123456, "eth-price-2025", "<", 30.0)
+        await user_repo.session.flush()
+
+        alerts = await user_repo.get_all_active_alerts(["eth-price-2025"])
+        assert [alert.event_slug for _, alert in alerts] == ["eth-price-2025"]
 
 
 @pytest.mark.asyncio
 class TestSeenEventsOperations:
     """Tests for seen events operations."""
 
-    async def test_mark_event_seen(self, test_db: DatabaseManager):
+    async def test_mark_event_seen(self, repo: Repository):
         """Test marking event as seen."""
-        async with test_db.session() as session:
-            repo = Repository(session)
-            await repo.mark_event_seen("event-123")
-            is_seen = await repo.is_event_seen("event-123")
-            assert is_seen is True
+        await repo.mark_event_seen("event-123")
+        await repo.session.flush()
+        is_seen = await repo.is_event_seen("event-123")
+        assert is_seen is True
 
-    async def test_event_not_seen(self, test_db: DatabaseManager):
+    async def test_event_not_seen(self, repo: Repository):
         """Test event not seen."""
-        async with test_db.session() as session:
-            repo = Repository(session)
-            is_seen = await repo.is_event_seen("event-456")
-            assert is_seen is False
+        is_seen = await repo.is_event_seen("event-456")
+        assert is_seen is False
+
+    async def test_mark_events_seen_skips_known(self, repo: Repository):
+        """Test bulk marking ignores events that are already seen."""
+        await repo.mark_events_seen(["event-1", "event-2"])
+        await repo.mark_events_seen(["event-2", "event-3"])
+        assert await repo.get_seen_events_count() == 3
 
-    async def test_cleanup_old_events(self, test_db: DatabaseManager):
+    async def test_cleanup_old_events(self, repo: Repository):
         """Test cleanup of old seen events."""
-        async with test_db.session() as session:
-            repo = Repository(session)
-            # Add many events
-            for i in range(15):
-                await repo.mark_event_seen(f"event-{i}")
-
-            # Cleanup to keep only 10
-            deleted = await repo.cleanup_old_seen_events(max_count=10)
+        # Add many events
+        await repo.mark_events_seen([f"event-{i}" for i in range(15)])
+
+        # Cleanup to keep only 10
+        deleted = await repo.cleanup_old_seen_events(max_count=10)
+        assert deleted == 5
+
+    async def test_cleanup_after_concurrent_marks(self, tmp_path: Path):
+        """Test events marked from concurrent sessions are all stored and cleaned up."""
+        db = DatabaseManager(f"sqlite+aiosqlite:///{tmp_path / 'concurrent.db'}")
+        await db.init_db()
+
+        async def mark(event_id: str) -> None:
+            async with db.session() as session:
+                await Repository(session).mark_event_seen(event_id)
+
+        try:
+            async with asyncio.TaskGroup() as tg:
+                for i in range(15):
+                    tg.create_task(mark(f"event-{i}"))
+
+            async with db.session() as session:
+                deleted = await Repository(session).cleanup_old_seen_events(max_count=10)
             assert deleted == 5
+        finally:
+            await db.close()
+
+
+@pytest.mark.asyncio
+class TestNewsCacheOperations:
+    """Tests for news cache operations."""
+
+    async def test_legacy_hash_not_reported_as_change(self, repo: Repository):
+        """Test a hash stored by the old MD5 hash_context is revalidated, not an update."""
+        context = "Bitcoin rallied after the ETF approval"
+        await repo.update_news_cache("btc", "0" * 32, context)
+        await repo.session.flush()
+
+        assert await repo.update_news_cache("btc", hash_context(context), context) is False
+        assert await repo.update_news_cache("btc", hash_context("New update"), "x") is True
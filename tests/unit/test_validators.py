@@ -17,31 +17,32 @@ from src.utils.validators import (
 class TestKeywordsInput:
     """Tests for KeywordsInput validator."""
 
-    def test_valid_keywords(self):
-        """Test valid keyword input."""
-        result = KeywordsInput(keywords=["btc", "eth", "crypto"])
-        assert len(result.keywords) == 3
-        assert "btc" in result.keywords
-
-    def test_keywords_lowercased(self):
-        """Test keywords are lowercased."""
-        result = KeywordsInput(keywords=["BTC", "ETH"])
-        assert result.keywords == ["btc", "eth"]
-
-    def test_empty_keywords_filtered(self):
-        """Test empty keywords are filtered."""
-        result = KeywordsInput(keywords=["btc", "", "  ", "eth"])
-        assert result.keywords == ["btc", "eth"]
-
-    def test_keyword_too_short(self):
-        """Test keyword too short validation."""
+    @pytest.mark.parametrize(
+        ("keywords", "expected"),
+        [
+            (["btc", "eth", "crypto"], ["btc", "eth", "crypto"]),
+            (["BTC", "ETH"], ["btc", "eth"]),
+            (["btc", "", "  ", "eth"], ["btc", "eth"]),
+            (
+                ['"united states"', "e-sports", "выборы"],
+                ['"united states"', "e-sports", "выборы"],
+            ),
+        ],
+        ids=["valid", "lowercased", "empty-filtered", "allowed-characters"],
+    )
+    def test_valid_keywords(self, keywords, expected):
+        """Test valid keywords are normalized."""
+        assert KeywordsInput(keywords=keywords).keywords == expected
+
+    @pytest.mark.parametrize(
+        "keywords",
+        [["a"], ["a" * 100], ["btc$"]],
+        ids=["too-short", "too-long", "invalid-characters"],
+    )
+    def test_invalid_keywords(self, keywords):
+        """Test invalid keywords are rejected."""
         with pytest.raises(ValidationError):
-            KeywordsInput(keywords=["a"])
-
-    def test_keyword_too_long(self):
-        """Test keyword too long validation."""
-        with pytest.raises(ValidationError):
-            KeywordsInput(keywords=["a" * 100])
+            KeywordsInput(keywords=keywords)
 
 
 class TestAlertInput:
@@ -58,40 +59,41 @@ class TestAlertInput:
         assert result.condition == ">"
         assert result.threshold == 70.0
 
-    def test_invalid_condition(self):
-        """Test invalid condition."""
-        with pytest.raises(ValidationError):
-            AlertInput(event_slug="test", condition="=", threshold=50)
-
-    def test_threshold_out_of_range(self):
-        """Test threshold validation."""
-        with pytest.raises(ValidationError):
-            AlertInput(event_slug="test", condition=">", threshold=150)
-
-    def test_invalid_slug_format(self):
-        """Test slug format validation."""
+    @pytest.mark.parametrize(
+        ("event_slug", "condition", "threshold"),
+        [
+            ("test", "=", 50),
+            ("test", ">", 150),
+            ("test/invalid", ">", 50),
+        ],
+        ids=["invalid-condition", "threshold-out-of-range", "invalid-slug-format"],
+    )
+    def test_invalid_alert(self, event_slug, condition, threshold):
+        """Test invalid alert input is rejected."""
         with pytest.raises(ValidationError):
-            AlertInput(event_slug="test/invalid", condition=">", threshold=50)
+            AlertInput(event_slug=event_slug, condition=condition, threshold=threshold)
 
 
 class TestCategoriesInput:
     """Tests for CategoriesInput validator."""
 
-    def test_valid_categories(self):
-        """Test valid categories."""
-        result = CategoriesInput(categories=["crypto", "politics"])
-        assert len(result.categories) == 2
+    @pytest.mark.parametrize(
+        ("categories", "expected"),
+        [
+            (["crypto", "politics"], ["crypto", "politics"]),
+            (["crypto", "invalid", "sports"], ["crypto", "sports"]),
+        ],
+        ids=["valid", "mixed-valid-invalid"],
+    )
+    def test_valid_categories(self, categories, expected):
+        """Test only valid categories are kept."""
+        assert CategoriesInput(categories=categories).categories == expected
 
     def test_invalid_category(self):
         """Test invalid category rejected."""
         with pytest.raises(ValidationError):
             CategoriesInput(categories=["invalid_category"])
 
-    def test_mixed_valid_invalid(self):
-        """Test mixed categories - only valid kept."""
-        result = CategoriesInput(categories=["crypto", "invalid", "sports"])
-        assert result.categories == ["crypto", "sports"]
-
 
 class TestIntervalInput:
     """Tests for IntervalInput validator."""
@@ -125,6 +127,33 @@ class TestWatchInput:
         result = WatchInput(event_slug="BTC-PRICE-2025")
         assert result.event_slug == "btc-price-2025"
 
+    def test_slug_stripped(self):
+        """Test surrounding whitespace is removed before validation."""
+        result = WatchInput(event_slug="  btc-price-2025 ")
+        assert result.event_slug == "btc-price-2025"
+
+    @pytest.mark.parametrize(
+        "model",
+        [
+            lambda slug: WatchInput(event_slug=slug),
+            lambda slug: AlertInput(event_slug=slug, condition=">", threshold=50),
+        ],
+        ids=["watch", "alert"],
+    )
+    def test_invalid_slug_message(self, model):
+        """Test a malformed slug reports a readable message instead of the regex."""
+        with pytest.raises(ValidationError) as exc_info:
+            model("btc/price")
+        error = exc_info.value.errors()[0]
+        assert error["type"] == "slug_format"
+        assert error["msg"] == "Invalid slug format (use alphanumeric and hyphens only)"
+
+    def test_short_slug_message_unchanged(self):
+        """Test length errors still use pydantic's own message."""
+        with pytest.raises(ValidationError) as exc_info:
+            WatchInput(event_slug="ab")
+        assert exc_info.value.errors()[0]["type"] == "string_too_short"
+
 
 class TestParseKeywords:
     """Tests for parse_keywords function."""
@@ -140,26 +169,24 @@ class TestParseKeywords:
         assert '"united states"' in result
         assert "election" in result
 
+    def test_blank_tokens_skipped(self):
+        """Test empty and whitespace-only tokens are dropped."""
+        assert parse_keywords(" btc ,, , 'uk' ,") == ["btc", "'uk'"]
+
 
 class TestValidatePolymarketUrl:
     """Tests for validate_polymarket_url function."""
 
-    def test_full_url(self):
-        """Test full Polymarket URL."""
-        result = validate_polymarket_url("https://polymarket.com/event/btc-price-2025")
-        assert result == "btc-price-2025"
-
-    def test_slug_only(self):
-        """Test slug input."""
-        result = validate_polymarket_url("btc-price-2025")
-        assert result == "btc-price-2025"
-
-    def test_invalid_url(self):
-        """Test invalid URL."""
-        result = validate_polymarket_url("https://example.com/test")
-        assert result is None
-
-    def test_too_short(self):
-        """Test too short input."""
-        result = validate_polymarket_url("ab")
-        assert result is None
+    @pytest.mark.parametrize(
+        ("value", "expected"),
+        [
+            ("https://polymarket.com/event/btc-price-2025", "btc-price-2025"),
+            ("btc-price-2025", "btc-price-2025"),
+            ("https://example.com/test", None),
+            ("ab", None),
+        ],
+        ids=["full-url", "slug-only", "invalid-url", "too-short"],
+    )
+    def test_validate_polymarket_url(self, value, expected):
+        """Test slugs are extracted from URLs or bare slugs."""
+        assert validate_polymarket_url(value) == expected